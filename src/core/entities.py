@@ -0,0 +1,27 @@
+"""Slotted records for short-lived, high-churn entities."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+
+@dataclass(slots=True)
+class ArchiveProjectile:
+    x: float
+    y: float
+    vx: float
+    vy: float
+    ttl: float
+    radius: int = 10
+    color: tuple[int, int, int] = (90, 210, 255)
+    damage: float = 16.0
+
+
+@dataclass(slots=True)
+class PulseState:
+    timer: float = 4.0
+    phase: str = "idle"  # idle -> warning -> firing
+    applied: bool = False
+    interval: float = 5.0
+    warning: float = 1.2
+    duration: float = 0.9
@@ -5,12 +5,15 @@ import json
 from pathlib import Path
 import random
 import math
+from array import array
 from collections import deque
 from datetime import datetime
+from typing import Sequence
 
 import pygame
 
 from . import settings
+from .entities import ArchiveProjectile, PulseState
 from ..systems.ui import AchievementsMenu, EndMenu, LoadMenu, PauseMenu, StartMenu
 from ..maps.loader import load_map, MapData
 from ..systems import collision
@@ -47,7 +50,30 @@ class Game:
         self.map_surface: pygame.Surface | None = None
         self.map_offset = (0, 0)
         self.map_scale = settings.MAP_SCALE
-        self._base_collision_grid: list[list[int]] = []
+        self._cell_px = settings.CELL_SIZE * settings.MAP_SCALE
+        self._cell_half = self._cell_px // 2
+        # projectile hit tests treat the player as a circle of this radius
+        self._player_radius = max(settings.PLAYER_SIZE) * 0.5
+        self._base_collision_grid: list[bytes] = []
+        # per-floor caches so revisiting a floor skips image decode/scale and the grid snapshot
+        self._base_grid_cache: dict[str, list[bytes]] = {}
+        self._map_surface_cache: dict[tuple[str, float], pygame.Surface] = {}
+        self._lab_surface_cache: dict[str, pygame.Surface] = {}
+        self._passable_lut = pathfinding.passable_lut(settings.PASSABLE_VALUES)
+        self._passable_mask: list[bytearray] = []
+        self._grid_version = 0
+        self._minimap_cache: tuple[int, pygame.Surface] | None = None
+        self._disc_cache: dict[tuple, pygame.Surface] = {}  # pre-drawn circles for bullets/enemies
+        self._image_cache: dict[str, pygame.Surface] = {}  # decoded sprites reused across floor loads
+        self._overlay_cache: dict[tuple, pygame.Surface] = {}  # filled+bordered boxes for trap/barrier overlays
+        self._logic_glow_cache: tuple[int, pygame.Surface] | None = None
+        self._boss_flash_cache: pygame.Surface | None = None
+        self._boss_fade_cache: tuple[pygame.Surface, pygame.Surface] | None = None
+        self._boss_bar_cache: tuple[int, pygame.Surface] | None = None  # (fill width, composed bar)
+        self._flash_overlay_cache: dict[int, pygame.Surface] = {}  # full-screen archive flash tints by alpha
+        self._vortex_cache: dict[tuple, pygame.Surface] = {}  # resonator vortex rings by (radius, color, alpha)
+        self._logic_overlay_cache: tuple[str, pygame.Surface, pygame.Surface] | None = None
+        self._interaction_zone_cache: tuple[tuple[str, float], list[dict]] | None = None
         self.lab_surface: pygame.Surface | None = None
         self.lab_npc_sprite: pygame.Surface | None = None
         self.player_rect = pygame.Rect(0, 0, *settings.PLAYER_SIZE)  # map-space rect
@@ -60,6 +86,7 @@ class Game:
         self.path: list[tuple[int, int]] = []  # list of map-cell nodes
         self.path_target: tuple[int, int] | None = None
         self.path_goal_cell: tuple[int, int] | None = None
+        self._path_dir_cache: tuple[tuple[int, int], float, float, tuple[int, int]] | None = None
         self.nav_cache_player: dict | None = None
         self.nav_cache_enemy: dict | None = None
         self.player_move_speed = float(settings.PLAYER_SPEED)
@@ -70,13 +97,54 @@ class Game:
         self.ambient_dialog_lines: list[str] = []
         self.ambient_dialog_timer: float = 0.0
         self.ambient_dialog_title: str = ""
+        self._dialog_render_cache: tuple[tuple, pygame.Surface] | None = None
+        self._ambient_render_cache: tuple[tuple, pygame.Surface] | None = None
+        self._dialog_overlay: pygame.Surface | None = None  # translucent strip under both dialog kinds
         self.click_fx_pos: tuple[int, int] | None = None
         self.click_fx_timer: float = 0.0
         self._conflict_x = False
         self._conflict_y = False
         self._keys_down: set[int] = set()
-        self._held_dirs = {"left": False, "right": False, "up": False, "down": False}
+        self._held_dirs = 0  # bitfield: 1 left, 2 right, 4 up, 8 down
+        # key lookup tables for _handle_event
+        self._dir_keys = {
+            pygame.K_a: 1,
+            pygame.K_LEFT: 1,
+            pygame.K_d: 2,
+            pygame.K_RIGHT: 2,
+            pygame.K_w: 4,
+            pygame.K_UP: 4,
+            pygame.K_s: 8,
+            pygame.K_DOWN: 8,
+        }
+        self._weapon_slot_keys = {
+            pygame.K_1: 0,
+            pygame.K_2: 1,
+            pygame.K_3: 2,
+            pygame.K_KP1: 0,
+            pygame.K_KP2: 1,
+            pygame.K_KP3: 2,
+        }
+        self._key_actions = {
+            pygame.K_F2: self._debug_jump_to_lab,
+            pygame.K_f: self._interact_key,
+            pygame.K_r: self._start_reload,
+            pygame.K_SPACE: self._try_fire,
+        }
+        # boss volleys: aim-relative fan directions depend only on phase/mood, so they are built once
+        # archive phase -> (directions, speed_px, fire interval, damage)
+        self._archive_fire_patterns = {
+            1: (self._fan_directions(3, math.radians(20)), 230.0, 5.0, 18),
+            2: (self._fan_directions(4, math.radians(26)), 260.0, 4.0, 24),
+            3: (self._fan_directions(5, math.radians(32)), 300.0, 3.0, 30),
+        }
+        # resonator mood -> (directions, speed_px, damage, radius, slow)
+        self._resonator_fire_patterns = {
+            "anger": (self._fan_directions(5, math.radians(18)), 360.0, 26.0, 10, 0.0),
+            "sadness": (self._fan_directions(7, math.radians(14)), 220.0, 18.0, 12, 1.4),
+        }
         self.bullets: list[dict] = []
+        self._bullet_pool: list[dict] = []  # spent bullet dicts, refilled by _spawn_bullet
         self.enemies: list[dict] = []
         self.combat_active = False
         self.weapon_slots = list(settings.WEAPON_SLOTS)
@@ -86,6 +154,7 @@ class Game:
         self._prime_weapon_ammo(reset_all=True)
         self.reload_timer = 0.0
         self.fire_cooldown = 0.0
+        self._ammo_cached: tuple[tuple, pygame.Surface | None] = ((), None)
         self.interact_mask: pygame.Surface | None = None
         self.dialog_title: str = ""
         self.intro_active = False
@@ -93,14 +162,37 @@ class Game:
         self.intro_timer = 0.0
         self.reveal_progress = 0.0
         self.player_fade = 0.0
+        self._mosaic_pyramid: list[pygame.Surface] = []
+        self._mosaic_cache: tuple[int, pygame.Surface] | None = None
         self.boot_sound: pygame.mixer.Sound | None = None
         self.cutscene_active = False
-        self.cutscene_lines: list[dict] = []
+        self.cutscene_lines: Sequence[tuple[str, str]] = ()
         self.cutscene_idx = 0
         self.cutscene_char_progress = 0.0
+        self.cutscene_shown_len = 0
         self.cutscene_done_line = False
         self.cutscene_started = False
         self.cutscene_on_complete = ""
+        self._text_cache: dict[tuple[int, str, tuple], pygame.Surface] = {}
+        self._font_cache: dict[tuple[Path | None, int], pygame.font.Font] = {}
+        self._cutscene_line_surf: pygame.Surface | None = None
+        shade = 255 - settings.DIALOG_OVERLAY_ALPHA
+        self._cutscene_shade = (shade, shade, shade)
+        overlay_h = int(settings.WINDOW_HEIGHT * settings.DIALOG_OVERLAY_HEIGHT_RATIO)
+        self._cutscene_strip = pygame.Rect(0, settings.WINDOW_HEIGHT - overlay_h, settings.WINDOW_WIDTH, overlay_h)
+        self._cutscene_pad = settings.DIALOG_PADDING + 8
+        self._cutscene_text_len = 0
+        self._cutscene_cps = float(settings.DIALOG_TYPE_SPEED_MIN)
+        self._cutscene_speaker_ids: tuple[int, ...] = ()
+        self._cutscene_texts: tuple[str, ...] = ()
+        self._cutscene_text_lens: tuple[int, ...] = ()
+        self._cutscene_cps_table: tuple[float, ...] = ()
+        self._speaker_surf_by_id: list[pygame.Surface] = []
+        self._cutscene_line_surfs: list[pygame.Surface | None] = []
+        self._cutscene_line_offsets: list[array] = []
+        self._cutscene_last_state: tuple | None = None
+        self._cutscene_composed: tuple[pygame.Surface, pygame.Rect] | None = None
+        self._cutscene_char_x = array("i", [0])
         self.enemy_attack_fx: list[dict] = []
         self.player_hit_timer = 0.0
         self.player_health_max = settings.PLAYER_MAX_HEALTH
@@ -124,9 +216,9 @@ class Game:
         self.archive_warning_radius = 0.0
         self.archive_boss: dict | None = None
         self.archive_flags: dict[str, bool] = {}
-        self.archive_projectiles: list[dict] = []
+        self.archive_projectiles: list[ArchiveProjectile] = []
         self.archive_flash_sequence: list[dict] = []
-        self.archive_pulse_state: dict[str, float] = {}
+        self.archive_pulse_state = PulseState()
         self.archive_boss_sprite: pygame.Surface | None = self._load_archive_boss_sprite()
         self.archive_flash_active = False
         self.archive_flash_step = 0
@@ -138,6 +230,8 @@ class Game:
         self.sanctuary_state: dict[str, object] = {}
         self.mirror_state: dict[str, object] = {}
         self.mirror_assets: dict[str, pygame.Surface] = {}
+        self._mirror_avatar_cache: tuple[pygame.Surface, pygame.Surface] | None = None  # (source sprite, tinted mirror)
+        self._mirror_pulse_surf: pygame.Surface | None = None
         self.floor0_state: dict[str, object] = {}
         self.floor0_assets: dict[str, pygame.Surface] = {}
         self.aera_sprite: pygame.Surface | None = None
@@ -155,15 +249,16 @@ class Game:
         self._last_save_path: Path | None = None
         self._loading_save = False
         self._save_check_timer = 0.0
-        self.debug_press_times: list[float] = []
+        self.debug_press_times: deque[int] = deque(maxlen=5)  # get_ticks() ms; only the last five matter
         self.debug_menu_active = False
         self.debug_menu_options: list[tuple[str, str]] = []
         self.debug_menu_index = 0
+        # debug menu chrome and (normal, active) entry renders, built when the menu opens
+        self._debug_static_surfaces: tuple[pygame.Surface, ...] | None = None
+        self._debug_entry_surfaces: list[tuple[pygame.Surface, pygame.Surface]] = []
         self.quest_stage = "intro"  # Ensure quest stage reset in _load_floor
         self.elevator_locked = True
-        self.font_path = self._resolve_font()
-        self.font_prompt = self._load_font(18)
-        self.font_dialog = self._load_font(20)
+        self._load_fonts()
 
         self.current_floor = settings.START_FLOOR
         self._load_floor(settings.MAP_FILES[self.current_floor], preserve_health=False)
@@ -178,8 +273,20 @@ class Game:
         self.end_menu_active = False
         self.achievements_origin = None
         self.map_scale = self._resolve_map_scale()
-        self._base_collision_grid = [row[:] for row in self.map_data.collision_grid]
-        self.map_surface = self._build_map_surface(self.map_data)
+        self._cell_px = max(1, int(self.map_data.cell_size * self.map_scale))
+        self._cell_half = self._cell_px // 2
+        map_key = str(path)
+        base_grid = self._base_grid_cache.get(map_key)
+        if base_grid is None:
+            base_grid = [bytes(row) for row in self.map_data.collision_grid]
+            self._base_grid_cache[map_key] = base_grid
+        self._base_collision_grid = base_grid
+        surface_key = (map_key, self.map_scale)
+        map_surface = self._map_surface_cache.get(surface_key)
+        if map_surface is None:
+            map_surface = self._build_map_surface(self.map_data)
+            self._map_surface_cache[surface_key] = map_surface
+        self.map_surface = map_surface
         map_w, map_h = self.map_surface.get_size()
         self.map_offset = (
             (settings.WINDOW_WIDTH - map_w) // 2,
@@ -203,7 +310,8 @@ class Game:
         self._conflict_x = False
         self._conflict_y = False
         self._keys_down.clear()
-        self._held_dirs = {"left": False, "right": False, "up": False, "down": False}
+        self._held_dirs = 0
+        self._bullet_pool.extend(self.bullets)
         self.bullets.clear()
         self.enemies.clear()
         self.combat_active = False
@@ -216,10 +324,14 @@ class Game:
         self.intro_timer = 0.0
         self.reveal_progress = 0.0
         self.player_fade = 0.0
+        self._mosaic_pyramid = []
+        self._mosaic_cache = None
         self.cutscene_active = False
-        self.cutscene_lines = []
+        self.cutscene_lines = ()
+        self._index_cutscene_lines()
         self.cutscene_idx = 0
         self.cutscene_char_progress = 0.0
+        self.cutscene_shown_len = 0
         self.cutscene_done_line = False
         self.cutscene_started = False
         self.enemy_attack_fx = []
@@ -235,12 +347,12 @@ class Game:
         self.regen_cooldown = 0.0
         self.regen_active = False
         self.any_enemy_aggro = False
-        self.dynamic_blockers = []
-        self.floor_flags = {}
-        self.floor_timers = {}
-        self.lab_traps = []
-        self.lab_barriers = []
-        self.lab_npc_state = {}
+        self.dynamic_blockers.clear()
+        self.floor_flags.clear()
+        self.floor_timers.clear()
+        self.lab_traps.clear()
+        self.lab_barriers.clear()
+        self.lab_npc_state.clear()
         self.lab_branch = ""
         self.lab_npc_sprite = None
         self.lab_gate_cells = []
@@ -250,45 +362,40 @@ class Game:
         self.archive_core_radius = 0.0
         self.archive_warning_radius = 0.0
         self.archive_boss: dict | None = None
-        self.archive_flags: dict[str, bool] = {}
+        self.archive_flags.clear()
         self.lab_surface = None
         self.archive_boss = None
-        self.archive_flags = {}
-        self.archive_projectiles = []
-        self.resonator_projectiles = []
-        self.resonator_state = {}
-        self.sanctuary_state = {}
-        self.mirror_state = {}
+        self.archive_projectiles.clear()
+        self.resonator_projectiles.clear()
+        self.resonator_state.clear()
+        self.sanctuary_state.clear()
+        self.mirror_state.clear()
         self.aera_sprite = None
-        self.floor0_state = {}
-        self.archive_flash_sequence = []
-        self.archive_pulse_state = {}
+        self.floor0_state.clear()
+        self.archive_flash_sequence.clear()
+        self.archive_pulse_state = PulseState()
         self.archive_flash_active = False
         self.archive_flash_step = 0
         self.archive_flash_timer = 0.0
         self.archive_minor_spawn_timer = 0.0
         if self.archive_boss_sprite is None:
             self.archive_boss_sprite = self._load_archive_boss_sprite()
-        self.logic_flags = {}
-        self.logic_sequence = []
-        self.logic_progress = []
+        self.logic_flags.clear()
+        self.logic_sequence.clear()
+        self.logic_progress.clear()
         self.logic_glitch_timer = 0.0
         self.logic_overlay_timer = 0.0
         self.logic_overlay_text = ""
-        self.logic_relay_positions = {}
+        self.logic_relay_positions.clear()
         self.quest_stage = "intro"
         self.elevator_locked = True
-        self.font_path = self._resolve_font()
-        self.font_prompt = self._load_font(18)
-        self.font_dialog = self._load_font(20)
         self.player_sprite = self._default_player_sprite()
         self._player_anim_index = 0
         self._player_anim_timer = 0.0
         self._player_was_moving = False
         mask_path = settings.INTERACT_MASKS.get(self.current_floor)
         if mask_path and mask_path.exists():
-            mask = pygame.image.load(str(mask_path)).convert_alpha()
-            self.interact_mask = mask
+            self.interact_mask = self._load_image(mask_path)
         else:
             self.interact_mask = None
         # Boot sound (optional)
@@ -313,14 +420,14 @@ class Game:
         cell = data.cell_size
         surf = pygame.Surface((int(data.grid_size[0] * cell * self.map_scale), int(data.grid_size[1] * cell * self.map_scale)))
         surf.fill(settings.MAP_BG_COLOR)
-        for y, row in enumerate(data.collision_grid):
-            for x, val in enumerate(row):
-                if val == 1:
-                    pygame.draw.rect(
-                        surf,
-                        settings.MAP_BLOCK_COLOR,
-                        (x * cell * self.map_scale, y * cell * self.map_scale, cell * self.map_scale, cell * self.map_scale),
-                    )
+        grid_w, grid_h = data.grid_size
+        if grid_w <= 0 or grid_h <= 0:
+            return surf
+        # one palette pixel per cell (1 -> block), then a single scale blit instead of per-cell rects
+        block_lut = bytes(1 if value == 1 else 0 for value in range(256))
+        cells = pygame.image.frombuffer(b"".join(data.collision_grid).translate(block_lut), (grid_w, grid_h), "P")
+        cells.set_palette([settings.MAP_BG_COLOR, settings.MAP_BLOCK_COLOR])
+        surf.blit(pygame.transform.scale(cells, (grid_w * self._cell_px, grid_h * self._cell_px)), (0, 0))
         return surf
 
     def run(self) -> None:
@@ -412,55 +519,22 @@ class Game:
                 if event.key in (pygame.K_SPACE, pygame.K_RETURN):
                     self._dismiss_dialog()
                 return
-            if event.key in (pygame.K_1, pygame.K_2, pygame.K_3, pygame.K_KP1, pygame.K_KP2, pygame.K_KP3):
-                slot_map = {
-                    pygame.K_1: 0,
-                    pygame.K_2: 1,
-                    pygame.K_3: 2,
-                    pygame.K_KP1: 0,
-                    pygame.K_KP2: 1,
-                    pygame.K_KP3: 2,
-                }
-                self._switch_weapon_slot(slot_map[event.key])
+            slot = self._weapon_slot_keys.get(event.key)
+            if slot is not None:
+                self._switch_weapon_slot(slot)
                 return
-            if event.key == pygame.K_F2:
-                # Quick swap to Floor40 for testing
-                self.current_floor = "F40"
-                self._load_floor(settings.MAP_FILES[self.current_floor])
-            if event.key == pygame.K_f and self.interaction_target:
-                self._activate_interaction(self.interaction_target)
-            if event.key == pygame.K_r:
-                self._start_reload()
-            if event.key == pygame.K_SPACE:
-                if self.dialog_lines:
-                    self._dismiss_dialog()
-                    return
-                self._try_fire()
+            action = self._key_actions.get(event.key)
+            if action:
+                action()
             self._keys_down.add(event.key)
-            if event.key in (pygame.K_a, pygame.K_LEFT):
-                self._held_dirs["left"] = True
-            if event.key in (pygame.K_d, pygame.K_RIGHT):
-                self._held_dirs["right"] = True
-            if event.key in (pygame.K_w, pygame.K_UP):
-                self._held_dirs["up"] = True
-            if event.key in (pygame.K_s, pygame.K_DOWN):
-                self._held_dirs["down"] = True
+            self._held_dirs |= self._dir_keys.get(event.key, 0)
         if event.type == pygame.KEYUP:
-            if event.key in self._keys_down:
-                self._keys_down.discard(event.key)
-            if event.key in (pygame.K_a, pygame.K_LEFT):
-                self._held_dirs["left"] = False
-            if event.key in (pygame.K_d, pygame.K_RIGHT):
-                self._held_dirs["right"] = False
-            if event.key in (pygame.K_w, pygame.K_UP):
-                self._held_dirs["up"] = False
-            if event.key in (pygame.K_s, pygame.K_DOWN):
-                self._held_dirs["down"] = False
+            self._keys_down.discard(event.key)
+            self._held_dirs &= ~self._dir_keys.get(event.key, 0)
         if event.type == pygame.WINDOWFOCUSLOST:
             # Clear held keys on focus loss to avoid stuck movement
             self._keys_down.clear()
-            for k in self._held_dirs:
-                self._held_dirs[k] = False
+            self._held_dirs = 0
         if event.type == pygame.MOUSEBUTTONDOWN:
             if self.player_dead or self.dialog_lines:
                 return
@@ -469,6 +543,15 @@ class Game:
             if event.button == 3:
                 self._handle_right_click(event.pos)
 
+    def _debug_jump_to_lab(self) -> None:
+        # Quick swap to Floor40 for testing
+        self.current_floor = "F40"
+        self._load_floor(settings.MAP_FILES[self.current_floor])
+
+    def _interact_key(self) -> None:
+        if self.interaction_target:
+            self._activate_interaction(self.interaction_target)
+
     def _toggle_pause_menu(self, state: bool | None = None) -> None:
         next_state = (not self.pause_menu_active) if state is None else state
         if next_state == self.pause_menu_active:
@@ -480,8 +563,7 @@ class Game:
 
     def _reset_input_state(self) -> None:
         self._keys_down.clear()
-        for key in self._held_dirs:
-            self._held_dirs[key] = False
+        self._held_dirs = 0
         self._conflict_x = False
         self._conflict_y = False
 
@@ -592,7 +674,7 @@ class Game:
     def _draw_achievement_notice(self) -> None:
         if not self.achievement_notice_text or self.achievement_notice_timer <= 0.0:
             return
-        surf = self.font_prompt.render(self.achievement_notice_text, True, settings.PROMPT_TEXT)
+        surf = self._render_cached(self.font_prompt, self.achievement_notice_text, settings.PROMPT_TEXT)
         pad = 8
         bg_rect = surf.get_rect()
         bg_rect.width += pad * 2
@@ -877,8 +959,8 @@ class Game:
             self.interaction_target = None
             self._update_camera()
             return
-        # Ensure key state is refreshed even if no new events arrived this frame
-        pygame.event.pump()
+        # run() already pumped events this frame; the snapshot still catches keys held across
+        # floor loads, dialogs and menus whose KEYDOWN never reached _keys_down
         keys = pygame.key.get_pressed()
         manual_dx, manual_dy = self._manual_axis(keys, dt)
         moved = False
@@ -909,8 +991,8 @@ class Game:
         self._update_player_regen(dt)
         self._update_interaction_prompt()
 
+        # map triggers (exits) are handled via the interaction prompt + F key
         self._update_camera()
-        self._check_triggers()
 
     def _update_player_regen(self, dt: float) -> None:
         if self.player_dead:
@@ -937,35 +1019,29 @@ class Game:
                 self.regen_active = False
                 self.regen_cooldown = 0.0
 
-    def _check_triggers(self) -> None:
-        if not self.map_data:
-            return
-        px = self.player_rect.centerx
-        py = self.player_rect.centery
-        for trig in self.map_data.triggers:
-            # exit interactions now handled via prompt + F key
-            continue
-
     def _on_floor_loaded(self) -> None:
-        self.dynamic_blockers = []
-        self.floor_flags = {}
-        self.floor_timers = {}
-        self.lab_traps = []
-        self.lab_barriers = []
-        self.lab_npc_state = {}
+        self.dynamic_blockers.clear()
+        self.floor_flags.clear()
+        self.floor_timers.clear()
+        self.lab_traps.clear()
+        self.lab_barriers.clear()
+        self.lab_npc_state.clear()
         self.lab_branch = ""
         self.archive_center = (0.0, 0.0)
         self.archive_core_radius = 0.0
         self.archive_warning_radius = 0.0
         self.archive_boss: dict | None = None
-        self.archive_flags: dict[str, bool] = {}
+        self.archive_flags.clear()
         self.lab_surface = None
         if not self.map_data:
             return
         if self._base_collision_grid:
-            for y, row in enumerate(self._base_collision_grid):
-                if y < len(self.map_data.collision_grid):
-                    self.map_data.collision_grid[y] = row[:]  # restore base grid snapshot
+            # restore base grid snapshot in place; rows keep their identity
+            for row, base_row in zip(self.map_data.collision_grid, self._base_collision_grid):
+                row[:] = base_row
+        lut = self._passable_lut
+        self._passable_mask = [row.translate(lut) for row in self.map_data.collision_grid]
+        self._grid_version += 1
         self.nav_cache_player = None
         self.nav_cache_enemy = None
         if self.current_floor in {"F50", "F40", "F35", "F30", "F25", "F15", "F10", "F0"}:
@@ -1038,13 +1114,7 @@ class Game:
         self.archive_boss = None
         self.archive_projectiles = []
         self.archive_flash_sequence = []
-        self.archive_pulse_state = {
-            "timer": 4.0,
-            "interval": 5.0,
-            "warning": 1.6,
-            "duration": 1.0,
-            "phase": "idle",
-        }
+        self.archive_pulse_state = PulseState(warning=1.6, duration=1.0)
         self.archive_flash_active = False
         self.archive_flash_step = 0
         self.archive_flash_timer = 0.0
@@ -1273,20 +1343,23 @@ class Game:
         sprite = self._apply_transparent_background(sprite)
         self.floor0_assets["assistant"] = sprite
 
-    def _floor0_start_cutscene(self, lines: list[dict]) -> None:
+    def _floor0_start_cutscene(self, lines: Sequence[tuple[str, str]]) -> None:
         self.cutscene_lines = lines
         self.cutscene_idx = 0
         self.cutscene_char_progress = 0.0
+        self.cutscene_shown_len = 0
         self.cutscene_done_line = False
         self.cutscene_active = True
         self.cutscene_on_complete = "boot"
         self.cutscene_on_complete = "floor0"
+        self._index_cutscene_lines()
+        self._prepare_cutscene_line()
 
     def _floor0_cutscene_package(
         self,
         mirror_triggered: bool,
         solvent_used: bool,
-    ) -> tuple[int, str, list[dict], list[str]]:
+    ) -> tuple[int, str, list[tuple[str, str]], list[str]]:
         if mirror_triggered and not solvent_used:
             percent = 100
             header = "实验结论：觉醒度 100%"
@@ -1296,11 +1369,11 @@ class Game:
                 "标记：主体完全脱离锚定",
             ]
             lines = [
-                {"speaker": "系统总控", "text": "实验迭代 #7 状态：镜像协议触发，身份棱镜被击碎。"},
-                {"speaker": "系统总控", "text": "评估：实验成功。个体认知恢复度 100%，锚定协议失效。"},
-                {"speaker": "助手研究员", "text": "主任，他看穿了这是一场试验，连镜像协议都挡不住。"},
-                {"speaker": "助手研究员", "text": "建议立即终止后续循环，这已经不是可控的样本了。"},
-                {"speaker": "系统总控", "text": "记录为“完全觉醒”。封存实验体 P-7，转入人工审查。"},
+                ("系统总控", "实验迭代 #7 状态：镜像协议触发，身份棱镜被击碎。"),
+                ("系统总控", "评估：实验成功。个体认知恢复度 100%，锚定协议失效。"),
+                ("助手研究员", "主任，他看穿了这是一场试验，连镜像协议都挡不住。"),
+                ("助手研究员", "建议立即终止后续循环，这已经不是可控的样本了。"),
+                ("系统总控", "记录为“完全觉醒”。封存实验体 P-7，转入人工审查。"),
             ]
         elif not mirror_triggered and solvent_used:
             percent = 0
@@ -1311,10 +1384,10 @@ class Game:
                 "标记：完全依循指令",
             ]
             lines = [
-                {"speaker": "系统总控", "text": "实验迭代 #7 状态：主体完全听从系统指令。"},
-                {"speaker": "系统总控", "text": "评估：镜像协议未触发，认知溶解剂已注射。个体认知恢复度 0%。"},
-                {"speaker": "助手研究员", "text": "没有偏差，像模板一样干净……主任，我们要继续复制吗？"},
-                {"speaker": "系统总控", "text": "记录为“完全依赖”。装载下一号实验体，维持指令模板。"},
+                ("系统总控", "实验迭代 #7 状态：主体完全听从系统指令。"),
+                ("系统总控", "评估：镜像协议未触发，认知溶解剂已注射。个体认知恢复度 0%。"),
+                ("助手研究员", "没有偏差，像模板一样干净……主任，我们要继续复制吗？"),
+                ("系统总控", "记录为“完全依赖”。装载下一号实验体，维持指令模板。"),
             ]
         elif mirror_triggered and solvent_used:
             percent = 20
@@ -1325,10 +1398,10 @@ class Game:
                 "标记：可控觉醒状态",
             ]
             lines = [
-                {"speaker": "系统总控", "text": "实验迭代 #7 状态：身份棱镜被击碎，终端指令执行完毕。"},
-                {"speaker": "系统总控", "text": "评估：个体认知恢复度 20%。主体辨识真相，却仍选择效率路径。"},
-                {"speaker": "助手研究员", "text": "他看见了这里，却还是按下了注射器……忠诚还是绝望？"},
-                {"speaker": "系统总控", "text": "标记为“可控觉醒”。提高下一次迭代的诱导强度。"},
+                ("系统总控", "实验迭代 #7 状态：身份棱镜被击碎，终端指令执行完毕。"),
+                ("系统总控", "评估：个体认知恢复度 20%。主体辨识真相，却仍选择效率路径。"),
+                ("助手研究员", "他看见了这里，却还是按下了注射器……忠诚还是绝望？"),
+                ("系统总控", "标记为“可控觉醒”。提高下一次迭代的诱导强度。"),
             ]
         else:
             percent = 45
@@ -1339,10 +1412,10 @@ class Game:
                 "标记：情感干扰型脱锚",
             ]
             lines = [
-                {"speaker": "系统总控", "text": "实验迭代 #7 状态：主体拒绝执行终端指令。"},
-                {"speaker": "系统总控", "text": "评估：个体认知恢复度 45%。情感触发脱锚，仍未彻底看穿模拟。"},
-                {"speaker": "助手研究员", "text": "他选择保护艾拉，却还把我们当成现实。直觉在替他行动。"},
-                {"speaker": "系统总控", "text": "标记为“情感干扰型脱锚”。调整下一次实验的情绪噪声权重。"},
+                ("系统总控", "实验迭代 #7 状态：主体拒绝执行终端指令。"),
+                ("系统总控", "评估：个体认知恢复度 45%。情感触发脱锚，仍未彻底看穿模拟。"),
+                ("助手研究员", "他选择保护艾拉，却还把我们当成现实。直觉在替他行动。"),
+                ("系统总控", "标记为“情感干扰型脱锚”。调整下一次实验的情绪噪声权重。"),
             ]
         return percent, header, lines, summary
 
@@ -1562,16 +1635,7 @@ class Game:
         ttl = float(weapon_cfg.get("bullet_lifetime", settings.GUN_BULLET_LIFETIME))
         radius = int(weapon_cfg.get("bullet_radius", settings.GUN_BULLET_RADIUS))
         damage = float(weapon_cfg.get("damage", settings.PLAYER_BULLET_DAMAGE)) * 0.6
-        self.bullets.append({
-            "x": float(ax),
-            "y": float(ay),
-            "vx": dx / dist * speed,
-            "vy": dy / dist * speed,
-            "ttl": ttl,
-            "radius": radius,
-            "color": (170, 210, 255),
-            "damage": damage,
-        })
+        self._spawn_bullet(float(ax), float(ay), dx / dist * speed, dy / dist * speed, ttl, radius, (170, 210, 255), damage)
         state["aera_fire_timer"] = 0.6
 
     def _trigger_aera_dissolve(self) -> None:
@@ -1687,23 +1751,23 @@ class Game:
         x2 = int((ux + uw) * scale)
         y1 = int(uy * scale)
         y2 = int((uy + uh) * scale)
-        cells: list[tuple[int, int]] = []
-        for cy in range(y1, y2):
-            if cy < 0 or cy >= len(grid):
-                continue
-            row = grid[cy]
-            for cx in range(x1, x2):
-                if 0 <= cx < len(row):
-                    cells.append((cy, cx))
-        return cells
+        return self._lab_clamped_cells(grid, x1, y1, x2, y2)
+
+    def _lab_clamped_cells(self, grid: list[bytearray], x1: int, y1: int, x2: int, y2: int) -> list[tuple[int, int]]:
+        # clamp the span once instead of bounds-checking every cell
+        y1 = max(0, y1)
+        y2 = min(len(grid), y2)
+        x1 = max(0, x1)
+        x2 = min(len(grid[0]) if grid else 0, x2)
+        xs = range(x1, x2)
+        return [(cy, cx) for cy in range(y1, y2) for cx in xs]
 
     def _lab_rect_from_cells(self, cells: list[tuple[int, int]]) -> pygame.Rect:
         if not cells or not self.map_data:
             return pygame.Rect(0, 0, 0, 0)
-        min_y = min(cy for cy, _ in cells)
-        max_y = max(cy for cy, _ in cells)
-        min_x = min(cx for _, cx in cells)
-        max_x = max(cx for _, cx in cells)
+        ys, xs = zip(*cells)
+        min_y, max_y = min(ys), max(ys)
+        min_x, max_x = min(xs), max(xs)
         cell_px = self.map_data.cell_size
         return pygame.Rect(
             min_x * cell_px,
@@ -1726,17 +1790,21 @@ class Game:
             return []
         cell_size = max(1, int(self.map_data.cell_size))
         grid = self.map_data.collision_grid
-        x1 = max(0, int(px // cell_size))
-        y1 = max(0, int(py // cell_size))
-        x2 = min(len(grid[0]) if grid else 0, int((px + pw) // cell_size) + 1)
-        y2 = min(len(grid), int((py + ph) // cell_size) + 1)
-        cells: list[tuple[int, int]] = []
-        for cy in range(y1, y2):
-            row = grid[cy]
-            for cx in range(x1, x2):
-                if 0 <= cx < len(row):
-                    cells.append((cy, cx))
-        return cells
+        x1 = int(px // cell_size)
+        y1 = int(py // cell_size)
+        x2 = int((px + pw) // cell_size) + 1
+        y2 = int((py + ph) // cell_size) + 1
+        return self._lab_clamped_cells(grid, x1, y1, x2, y2)
+
+    def _lab_scaled_rect(self, rect: pygame.Rect) -> tuple[int, int, int, int]:
+        # map-space pixels; the camera offset is the only per-frame term left for drawing
+        scale = self.map_scale
+        return (
+            int(rect.x * scale),
+            int(rect.y * scale),
+            max(0, int(rect.width * scale)),
+            max(0, int(rect.height * scale)),
+        )
 
     def _lab_init_traps(self) -> None:
         if not self.map_data:
@@ -1782,7 +1850,10 @@ class Game:
             "sealed_announced": False,
         })
         for trap in self.lab_traps:
-            self._lab_set_cells(trap["cells"], False)
+            trap["draw_rect"] = self._lab_scaled_rect(trap["rect"])
+            # toggled many times per visit; keep the clipped row runs instead of re-walking cells
+            trap["spans"] = self._lab_cell_spans(trap["cells"])
+            self._lab_set_spans(trap["spans"], False)
         self.lab_barriers = []
 
     def _lab_refresh_surface(self) -> None:
@@ -1797,7 +1868,20 @@ class Game:
                 (settings.WINDOW_HEIGHT - map_h) // 2,
             )
             return
-        cell_px = self.map_data.cell_size * self.map_scale
+        cached = self._lab_surface_cache.get(self.current_floor)
+        if cached is None:
+            cached = self._build_lab_surface()
+            self._lab_surface_cache[self.current_floor] = cached
+        self.lab_surface = cached
+        self.map_surface = self.lab_surface
+        map_w, map_h = self.map_surface.get_size()
+        self.map_offset = (
+            (settings.WINDOW_WIDTH - map_w) // 2,
+            (settings.WINDOW_HEIGHT - map_h) // 2,
+        )
+
+    def _build_lab_surface(self) -> pygame.Surface:
+        cell_px = self._cell_px
         width = self.map_data.grid_size[0] * cell_px
         height = self.map_data.grid_size[1] * cell_px
         surf = pygame.Surface((width, height))
@@ -1806,14 +1890,22 @@ class Game:
         if not colors:
             colors = [(70, 110, 160)]
         block_span = max(1, getattr(settings, "LAB_BLOCK_SPAN", 12))
+        grid_w, grid_h = self.map_data.grid_size
+        count = len(colors)
+        # palette index per cell: 0 = wall, 1 + block colour for walkable cells; one pattern
+        # row per block-row phase, masked by the walkable row with a packed-int AND
+        patterns = [
+            int.from_bytes(bytes(1 + ((x // block_span) + phase) % count for x in range(grid_w)), "little")
+            for phase in range(count)
+        ]
+        keep_lut = self._passable_lut.translate(bytes([0, 0xFF]) + bytes(254))
+        indices = bytearray()
         for y, row in enumerate(self.map_data.collision_grid):
-            for x, val in enumerate(row):
-                if val not in settings.PASSABLE_VALUES:
-                    continue
-                block_index = ((x // block_span) + (y // block_span)) % len(colors)
-                color = colors[block_index]
-                rect = pygame.Rect(x * cell_px, y * cell_px, cell_px, cell_px)
-                surf.fill(color, rect)
+            keep = int.from_bytes(row.translate(keep_lut), "little")
+            indices += (keep & patterns[(y // block_span) % count]).to_bytes(grid_w, "little")
+        cells = pygame.image.frombuffer(bytes(indices), (grid_w, grid_h), "P")
+        cells.set_palette([settings.LAB_WALL_COLOR, *colors])
+        surf.blit(pygame.transform.scale(cells, (width, height)), (0, 0))
         interact_colors = getattr(settings, "LAB_INTERACT_COLORS", {})
         for trig in settings.INTERACT_ZONES.get("F40", []):
             color = interact_colors.get(trig.get("type", ""))
@@ -1827,13 +1919,7 @@ class Game:
                 max(1, int((y2 - y1) * self.map_scale)),
             )
             surf.fill(color, scaled_rect)
-        self.lab_surface = surf.convert()
-        self.map_surface = self.lab_surface
-        map_w, map_h = self.map_surface.get_size()
-        self.map_offset = (
-            (settings.WINDOW_WIDTH - map_w) // 2,
-            (settings.WINDOW_HEIGHT - map_h) // 2,
-        )
+        return surf.convert()
 
     def _lab_npc_rect(self) -> pygame.Rect | None:
         for trig in settings.INTERACT_ZONES.get("F40", []):
@@ -1848,7 +1934,7 @@ class Game:
         if not path.exists():
             return
         try:
-            sprite = pygame.image.load(str(path)).convert_alpha()
+            sprite = self._load_image(path)
         except Exception:
             return
         sprite = pygame.transform.rotate(sprite, 90)
@@ -2019,24 +2105,53 @@ class Game:
             nav_cache=nav_cache,
         )
 
-    def _lab_set_cells(self, cells: list[tuple[int, int]], solid: bool) -> None:
+    def _lab_cell_spans(self, cells: list[tuple[int, int]]) -> list[tuple[int, int, int]]:
+        # merge cells into in-bounds (row, x_start, x_end) runs so toggles are row slice writes
         if not self.map_data:
-            return
+            return []
         grid = self.map_data.collision_grid
-        base = self._base_collision_grid
-        for cy, cx in cells:
-            if cy < 0 or cy >= len(grid):
+        spans: list[tuple[int, int, int]] = []
+        run_y = run_x0 = run_x1 = -1
+        for cy, cx in sorted(set(cells)):
+            if cy < 0 or cy >= len(grid) or cx < 0 or cx >= len(grid[cy]):
                 continue
-            row = grid[cy]
-            if cx < 0 or cx >= len(row):
+            if cy == run_y and cx == run_x1:
+                run_x1 += 1
                 continue
+            if run_y >= 0:
+                spans.append((run_y, run_x0, run_x1))
+            run_y, run_x0, run_x1 = cy, cx, cx + 1
+        if run_y >= 0:
+            spans.append((run_y, run_x0, run_x1))
+        return spans
+
+    def _lab_set_spans(self, spans: list[tuple[int, int, int]], solid: bool) -> None:
+        if not self.map_data:
+            return
+        grid = self.map_data.collision_grid
+        base = self._base_collision_grid
+        mask = self._passable_mask
+        lut = self._passable_lut
+        changed = False
+        for cy, x0, x1 in spans:
+            width = x1 - x0
             if solid:
-                row[cx] = 1
+                values = b"\x01" * width
             else:
-                if base and cy < len(base) and cx < len(base[cy]):
-                    row[cx] = base[cy][cx]
-                else:
-                    row[cx] = 0
+                values = base[cy][x0:x1] if cy < len(base) else b""
+                if len(values) < width:
+                    # cells missing from the base snapshot restore as open floor
+                    values += bytes(width - len(values))
+            row = grid[cy]
+            if row[x0:x1] == values:
+                continue
+            row[x0:x1] = values
+            changed = True
+            if cy < len(mask):
+                mask[cy][x0:x1] = values.translate(lut)
+        # only a real change dirties grid-derived caches (minimap etc.)
+        if changed:
+            self._grid_version += 1
 
     def _lab_trigger_trap(self, trap_id: str) -> None:
         for trap in self.lab_traps:
@@ -2045,81 +2160,93 @@ class Game:
                     return
                 trap["state"] = "void"
                 trap["timer"] = trap.get("void_duration", 1.0)
-                self._lab_set_cells(trap["cells"], True)
+                self._lab_set_spans(trap["spans"], True)
                 break
 
     def _lab_update_traps(self, dt: float) -> None:
         for trap in self.lab_traps:
             if not trap.get("active"):
                 continue
-            state = trap.get("state")
-            if state == "void":
-                trap["timer"] = max(0.0, trap.get("timer", 0.0) - dt)
-                if trap["timer"] <= 0.0:
-                    if trap.get("permanent"):
-                        trap["state"] = "sealed"
-                        self._lab_set_cells(trap["cells"], True)
-                        if not trap.get("sealed_announced"):
-                            trap["sealed_announced"] = True
-                            self.floor_flags["lab_trap1_resolved"] = True
-                            self._show_dialog(["指引者：主干道塌陷，改道进入外圈。"], title="指引者")
-                    else:
-                        trap["state"] = "idle"
-                        self._lab_set_cells(trap["cells"], False)
-                        trap["timer"] = trap.get("cycle_interval", 0.0)
-            elif trap.get("cycle_interval", 0.0) > 0.0:
-                trap["timer"] = max(0.0, trap.get("timer", 0.0) - dt)
-                if trap["timer"] <= 0.0:
-                    trap["state"] = "void"
-                    trap["timer"] = trap.get("void_duration", 1.0)
-                    self._lab_set_cells(trap["cells"], True)
+            is_void = trap.get("state") == "void"
+            if not is_void and trap.get("cycle_interval", 0.0) <= 0.0:
+                continue
+            # shared countdown; only an expiring trap falls through to its transition
+            timer = trap.get("timer", 0.0) - dt
+            if timer > 0.0:
+                trap["timer"] = timer
+                continue
+            trap["timer"] = 0.0
+            if not is_void:
+                trap["state"] = "void"
+                trap["timer"] = trap.get("void_duration", 1.0)
+                self._lab_set_spans(trap["spans"], True)
+            elif trap.get("permanent"):
+                trap["state"] = "sealed"
+                self._lab_set_spans(trap["spans"], True)
+                if not trap.get("sealed_announced"):
+                    trap["sealed_announced"] = True
+                    self.floor_flags["lab_trap1_resolved"] = True
+                    self._show_dialog(["指引者：主干道塌陷，改道进入外圈。"], title="指引者")
+            else:
+                trap["state"] = "idle"
+                self._lab_set_spans(trap["spans"], False)
+                trap["timer"] = trap.get("cycle_interval", 0.0)
 
     def _draw_lab_traps(self) -> None:
         if not self.lab_traps:
             return
-        scale = self.map_scale
+        ox, oy = self.map_offset
+        clip = self.screen.get_clip()
+        batch = []
         for trap in self.lab_traps:
             state = trap.get("state")
             if state in {"idle"} or not trap.get("rect"):
                 continue
-            rect = trap["rect"]
-            draw_rect = pygame.Rect(
-                int(rect.x * scale + self.map_offset[0]),
-                int(rect.y * scale + self.map_offset[1]),
-                int(rect.width * scale),
-                int(rect.height * scale),
-            )
-            if draw_rect.width <= 0 or draw_rect.height <= 0:
+            x, y, width, height = trap["draw_rect"]
+            x += ox
+            y += oy
+            # skips empty rects too: colliderect is False for zero-area boxes
+            if not clip.colliderect(x, y, width, height):
                 continue
-            surf = pygame.Surface(draw_rect.size, pygame.SRCALPHA)
             if state == "void":
                 color = (180, 40, 120, 160)
             elif state == "sealed":
                 color = (80, 20, 110, 200)
             else:
                 color = (110, 30, 140, 140)
-            surf.fill(color)
-            pygame.draw.rect(surf, (255, 160, 240, 220), surf.get_rect(), 2)
-            self.screen.blit(surf, draw_rect.topleft)
+            surf = self._overlay_surface(width, height, color, (255, 160, 240, 220), 2)
+            batch.append((surf, (x, y)))
+        if batch:
+            self.screen.blits(batch, doreturn=False)
 
     def _draw_lab_barriers(self) -> None:
         if not self.lab_barriers:
             return
-        scale = self.map_scale
+        ox, oy = self.map_offset
+        clip = self.screen.get_clip()
+        batch = []
         for barrier in self.lab_barriers:
-            rect = barrier.get("rect")
-            if not rect:
+            if not barrier.get("rect"):
                 continue
-            draw_rect = pygame.Rect(
-                int(rect.x * scale + self.map_offset[0]),
-                int(rect.y * scale + self.map_offset[1]),
-                int(rect.width * scale),
-                int(rect.height * scale),
-            )
-            surf = pygame.Surface(draw_rect.size, pygame.SRCALPHA)
-            surf.fill((40, 160, 220, 140))
-            pygame.draw.rect(surf, (120, 220, 255, 220), surf.get_rect(), 3)
-            self.screen.blit(surf, draw_rect.topleft)
+            x, y, width, height = barrier["draw_rect"]
+            x += ox
+            y += oy
+            if not clip.colliderect(x, y, width, height):
+                continue
+            surf = self._overlay_surface(width, height, (40, 160, 220, 140), (120, 220, 255, 220), 3)
+            batch.append((surf, (x, y)))
+        if batch:
+            self.screen.blits(batch, doreturn=False)
+
+    def _overlay_surface(self, width: int, height: int, fill, border, border_width: int) -> pygame.Surface:
+        key = (width, height, fill, border, border_width)
+        surf = self._overlay_cache.get(key)
+        if surf is None:
+            surf = pygame.Surface((width, height), pygame.SRCALPHA)
+            surf.fill(fill)
+            pygame.draw.rect(surf, border, surf.get_rect(), border_width)
+            self._overlay_cache[key] = surf
+        return surf
 
     def _draw_lab_npc(self) -> None:
         rect = self._lab_npc_rect()
@@ -2151,13 +2278,22 @@ class Game:
         self._draw_archive_flash_overlay()
 
     def _draw_archive_projectiles(self) -> None:
+        if not self.archive_projectiles:
+            return
         ox, oy = self.map_offset
+        clip = self.screen.get_clip()
+        disc = self._disc_sprite
+        blits = []
         for proj in self.archive_projectiles:
-            sx = int(proj.get("x", 0.0) + ox)
-            sy = int(proj.get("y", 0.0) + oy)
-            radius = int(proj.get("radius", 10))
-            color = proj.get("color", (90, 210, 255))
-            pygame.draw.circle(self.screen, color, (sx, sy), radius)
+            radius = proj.radius
+            x = int(proj.x + ox) - radius
+            y = int(proj.y + oy) - radius
+            size = radius * 2 + 1
+            if not clip.colliderect(x, y, size, size):
+                continue
+            blits.append((disc(proj.color, radius), (x, y)))
+        if blits:
+            self.screen.blits(blits, doreturn=False)
 
     def _draw_archive_boss(self) -> None:
         boss = self.archive_boss
@@ -2171,7 +2307,12 @@ class Game:
             rect = sprite.get_rect(center=(sx, sy))
             if boss.get("state") == "dying":
                 fade = max(0.0, min(1.0, boss.get("fade", 0.0)))
-                surf = sprite.copy()
+                # one private copy for the fade-out; only its surface alpha changes per frame
+                cached = self._boss_fade_cache
+                if cached is None or cached[0] is not sprite:
+                    cached = (sprite, sprite.copy())
+                    self._boss_fade_cache = cached
+                surf = cached[1]
                 surf.set_alpha(int(255 * fade))
                 self.screen.blit(surf, rect)
             else:
@@ -2182,9 +2323,13 @@ class Game:
         flash = boss.get("flash", 0.0)
         if flash > 0.0:
             radius = int(boss.get("hit_radius", 80))
-            overlay = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
-            alpha = int(140 * min(1.0, flash / 0.12))
-            pygame.draw.circle(overlay, (255, 255, 255, alpha), (radius, radius), radius)
+            # one opaque white disc per radius; the flash strength is applied as surface alpha
+            overlay = self._boss_flash_cache
+            if overlay is None or overlay.get_width() != radius * 2:
+                overlay = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+                pygame.draw.circle(overlay, (255, 255, 255, 255), (radius, radius), radius)
+                self._boss_flash_cache = overlay
+            overlay.set_alpha(int(140 * min(1.0, flash / 0.12)))
             self.screen.blit(overlay, (sx - radius, sy - radius))
         self._draw_archive_boss_healthbar(boss, sx, sy)
 
@@ -2209,53 +2354,75 @@ class Game:
                 int((x2 - x1) * scale),
                 int((y2 - y1) * scale),
             )
-            glow_rect = pygame.Rect(0, 0, int(28 * scale), int(12 * scale))
+            glow = self._logic_glow_surface(scale)
+            glow_rect = glow.get_rect()
             glow_rect.centerx = rect.centerx
             glow_rect.top = rect.top + int(8 * scale)
-            glow = pygame.Surface(glow_rect.size, pygame.SRCALPHA)
-            pygame.draw.rect(glow, (120, 255, 170, 210), glow.get_rect(), border_radius=4)
             self.screen.blit(glow, glow_rect.topleft)
         if self.logic_overlay_timer > 0.0 and self.logic_overlay_text:
-            surf = self.font_dialog.render(self.logic_overlay_text, True, settings.TITLE_GLOW_COLOR)
+            # text and its backing panel only change when the overlay message does
+            cached = self._logic_overlay_cache
+            if cached is None or cached[0] != self.logic_overlay_text:
+                surf = self.font_dialog.render(self.logic_overlay_text, True, settings.TITLE_GLOW_COLOR)
+                bg = pygame.Surface((surf.get_width() + 28, surf.get_height() + 16), pygame.SRCALPHA)
+                bg.fill((18, 22, 30, 210))
+                cached = (self.logic_overlay_text, surf, bg)
+                self._logic_overlay_cache = cached
+            _, surf, bg = cached
             rect = surf.get_rect(center=(settings.WINDOW_WIDTH // 2, 108))
-            bg = pygame.Surface((rect.width + 28, rect.height + 16), pygame.SRCALPHA)
-            bg.fill((18, 22, 30, 210))
             self.screen.blit(bg, (rect.x - 14, rect.y - 8))
             self.screen.blit(surf, rect)
 
+    def _logic_glow_surface(self, scale: int) -> pygame.Surface:
+        cached = self._logic_glow_cache
+        if cached is None or cached[0] != scale:
+            glow = pygame.Surface((int(28 * scale), int(12 * scale)), pygame.SRCALPHA)
+            pygame.draw.rect(glow, (120, 255, 170, 210), glow.get_rect(), border_radius=4)
+            cached = (scale, glow)
+            self._logic_glow_cache = cached
+        return cached[1]
+
     def _draw_debug_menu(self) -> None:
-        overlay = pygame.Surface((settings.WINDOW_WIDTH, settings.WINDOW_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((10, 12, 20, 180))
-        self.screen.blit(overlay, (0, 0))
         panel_width = 460
         panel_height = 360
-        panel = pygame.Surface((panel_width, panel_height), pygame.SRCALPHA)
-        panel.fill((24, 30, 42, 235))
+        line_height = 36
+        if self._debug_static_surfaces is None:
+            overlay = pygame.Surface((settings.WINDOW_WIDTH, settings.WINDOW_HEIGHT), pygame.SRCALPHA)
+            overlay.fill((10, 12, 20, 180))
+            panel = pygame.Surface((panel_width, panel_height), pygame.SRCALPHA)
+            panel.fill((24, 30, 42, 235))
+            highlight = pygame.Surface((panel_width - 96, line_height - 6), pygame.SRCALPHA)
+            highlight.fill((60, 90, 140, 160))
+            self._debug_static_surfaces = (
+                overlay,
+                panel,
+                highlight,
+                self.font_dialog.render("DEBUG: 选项", True, settings.QUEST_TITLE),
+                self.font_prompt.render("无可用选项", True, settings.QUEST_TEXT),
+                self.font_prompt.render("↑/↓ 选择  Enter 确认  Esc 退出", True, settings.QUEST_TEXT),
+            )
+        overlay, panel, highlight, title, empty, hint = self._debug_static_surfaces
         px = (settings.WINDOW_WIDTH - panel_width) // 2
         py = (settings.WINDOW_HEIGHT - panel_height) // 2
-        self.screen.blit(panel, (px, py))
-        title = self.font_dialog.render("DEBUG: 选项", True, settings.QUEST_TITLE)
-        self.screen.blit(title, (px + (panel_width - title.get_width()) // 2, py + 18))
-        options = self.debug_menu_options
-        if not options:
-            empty = self.font_prompt.render("无可用选项", True, settings.QUEST_TEXT)
-            self.screen.blit(empty, (px + (panel_width - empty.get_width()) // 2, py + 90))
+        batch = [
+            (overlay, (0, 0)),
+            (panel, (px, py)),
+            (title, (px + (panel_width - title.get_width()) // 2, py + 18)),
+        ]
+        entries = self._debug_entry_surfaces if self.debug_menu_options else []
+        if not entries:
+            batch.append((empty, (px + (panel_width - empty.get_width()) // 2, py + 90)))
         else:
             start_y = py + 84
-            line_height = 36
-            for idx, (code, label) in enumerate(options):
-                is_active = idx == self.debug_menu_index
-                text_color = settings.QUEST_TEXT if not is_active else settings.QUEST_TITLE
-                entry = self.font_prompt.render(f"{code} - {label}", True, text_color)
-                tx = px + 48
+            tx = px + 48
+            for idx, (entry, active_entry) in enumerate(entries):
                 ty = start_y + idx * line_height
-                if is_active:
-                    highlight = pygame.Surface((panel_width - 96, line_height - 6), pygame.SRCALPHA)
-                    highlight.fill((60, 90, 140, 160))
-                    self.screen.blit(highlight, (tx - 8, ty - 2))
-                self.screen.blit(entry, (tx, ty))
-        hint = self.font_prompt.render("↑/↓ 选择  Enter 确认  Esc 退出", True, settings.QUEST_TEXT)
-        self.screen.blit(hint, (px + (panel_width - hint.get_width()) // 2, py + panel_height - 46))
+                if idx == self.debug_menu_index:
+                    batch.append((highlight, (tx - 8, ty - 2)))
+                    entry = active_entry
+                batch.append((entry, (tx, ty)))
+        batch.append((hint, (px + (panel_width - hint.get_width()) // 2, py + panel_height - 46)))
+        self.screen.blits(batch, doreturn=False)
 
 
     def _draw_archive_boss_healthbar(self, boss: dict, sx: int, sy: int) -> None:
@@ -2267,21 +2434,26 @@ class Game:
         height = 18
         bar_x = settings.WINDOW_WIDTH // 2 - width // 2
         bar_y = 50
-        pygame.draw.rect(self.screen, settings.ENEMY_HEALTH_BAR_BG, pygame.Rect(bar_x, bar_y, width, height))
-        if hp > 0:
-            ratio = max(0.0, min(1.0, hp / max_hp))
-            fill_rect = pygame.Rect(bar_x, bar_y, int(width * ratio), height)
-            pygame.draw.rect(self.screen, settings.ENEMY_HEALTH_BAR_COLOR, fill_rect)
-        pygame.draw.rect(self.screen, settings.ENEMY_HEALTH_BAR_BORDER, pygame.Rect(bar_x, bar_y, width, height), 2)
-        label = self.font_prompt.render("记忆吞噬者", True, settings.QUEST_TITLE)
+        fill_w = int(width * max(0.0, min(1.0, hp / max_hp))) if hp > 0 else 0
+        # the composed bar only changes when the boss takes damage
+        cached = self._boss_bar_cache
+        if cached is None or cached[0] != fill_w:
+            bar = pygame.Surface((width, height))
+            bar.fill(settings.ENEMY_HEALTH_BAR_BG)
+            if fill_w > 0:
+                bar.fill(settings.ENEMY_HEALTH_BAR_COLOR, pygame.Rect(0, 0, fill_w, height))
+            pygame.draw.rect(bar, settings.ENEMY_HEALTH_BAR_BORDER, bar.get_rect(), 2)
+            cached = (fill_w, bar)
+            self._boss_bar_cache = cached
+        self.screen.blit(cached[1], (bar_x, bar_y))
+        label = self._render_cached(self.font_prompt, "记忆吞噬者", settings.QUEST_TITLE)
         label_rect = label.get_rect(center=(settings.WINDOW_WIDTH // 2, bar_y - 18))
         self.screen.blit(label, label_rect)
 
     def _draw_archive_pulse_ring(self) -> None:
         if not self.archive_boss:
             return
-        pulse = self.archive_pulse_state
-        phase = pulse.get("phase", "idle")
+        phase = self.archive_pulse_state.phase
         if phase not in {"warning", "firing"}:
             return
         ox, oy = self.map_offset
@@ -2299,8 +2471,12 @@ class Game:
         active = self.archive_flash_active or bool(self.archive_flash_sequence)
         if not active:
             return
-        overlay = pygame.Surface((settings.WINDOW_WIDTH, settings.WINDOW_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((200, 230, 255, 70 if self.archive_flash_active else 50))
+        alpha = 70 if self.archive_flash_active else 50
+        overlay = self._flash_overlay_cache.get(alpha)
+        if overlay is None:
+            overlay = pygame.Surface((settings.WINDOW_WIDTH, settings.WINDOW_HEIGHT), pygame.SRCALPHA)
+            overlay.fill((200, 230, 255, alpha))
+            self._flash_overlay_cache[alpha] = overlay
         self.screen.blit(overlay, (0, 0))
 
     def _player_map_pos(self) -> tuple[float, float]:
@@ -2409,11 +2585,14 @@ class Game:
     def _lab_add_barrier(self, cells: list[tuple[int, int]]) -> None:
         if not cells:
             return
-        self._lab_set_cells(cells, True)
+        spans = self._lab_cell_spans(cells)
+        self._lab_set_spans(spans, True)
         rect = self._lab_rect_from_cells(cells)
         self.lab_barriers.append({
             "cells": cells,
+            "spans": spans,
             "rect": rect,
+            "draw_rect": self._lab_scaled_rect(rect),
         })
         self.floor_flags["lab_barrier_active"] = True
 
@@ -2452,6 +2631,10 @@ class Game:
     def _update_floor_f30(self, dt: float) -> None:
         if not self.map_data:
             return
+        flags = self.logic_flags
+        # solved and quiet: bootstrap, intro and server checks would all be no-ops this tick
+        if flags.get("servers_solved") and flags.get("intro_shown") and self.logic_overlay_timer <= 0.0:
+            return
         self._logic_bootstrap_servers()
         if not self.logic_flags.get("intro_shown"):
             timer = self.floor_timers.get("logic_intro_delay", 0.0) - dt
@@ -2628,10 +2811,13 @@ class Game:
         self._show_dialog(["开关没有响应。"], title="提示")
 
     def _register_debug_keypress(self) -> None:
-        now = pygame.time.get_ticks() / 1000.0
-        self.debug_press_times = [t for t in self.debug_press_times if now - t <= 0.8]
-        self.debug_press_times.append(now)
-        if len(self.debug_press_times) >= 5 and (now - self.debug_press_times[-5]) <= 0.9:
+        now = pygame.time.get_ticks()
+        times = self.debug_press_times
+        # presses arrive in order, so stale ones are always at the left
+        while times and now - times[0] > 800:
+            times.popleft()
+        times.append(now)
+        if len(times) >= 5 and (now - times[-5]) <= 900:
             self.debug_press_times.clear()
             self._open_debug_menu()
 
@@ -2641,6 +2827,13 @@ class Game:
             return
         self.debug_menu_options = options
         self.debug_menu_index = 0
+        self._debug_entry_surfaces = [
+            (
+                self.font_prompt.render(f"{code} - {label}", True, settings.QUEST_TEXT),
+                self.font_prompt.render(f"{code} - {label}", True, settings.QUEST_TITLE),
+            )
+            for code, label in options
+        ]
         self.debug_menu_active = True
         self.debug_press_times.clear()
         self._dismiss_dialog()
@@ -2732,6 +2925,17 @@ class Game:
     def _update_floor_f35(self, dt: float) -> None:
         if not self.map_data:
             return
+        flags = self.archive_flags
+        # after the audio log the floor is idle until the player leaves; skip the proximity and event checks
+        if (
+            flags.get("log_available")
+            and flags.get("hum_prompt_shown")
+            and not self.archive_boss
+            and not self.archive_projectiles
+            and not self.archive_flash_active
+            and not self.archive_flash_sequence
+        ):
+            return
         if not self.archive_flags.get("intro_dialog_shown"):
             timer = self.floor_timers.get("archive_intro_delay", 0.0) - dt
             if timer <= 0.0:
@@ -2747,13 +2951,14 @@ class Game:
         center_x, center_y = self.archive_center
         dx = px - center_x
         dy = py - center_y
-        dist = math.hypot(dx, dy)
-        if (not self.archive_flags.get("hum_prompt_shown")) and dist <= self.archive_warning_radius:
+        # radii are non-negative, so squared distances give the same comparisons without a sqrt
+        dist_sq = dx * dx + dy * dy
+        if (not self.archive_flags.get("hum_prompt_shown")) and dist_sq <= self.archive_warning_radius ** 2:
             self.archive_flags["hum_prompt_shown"] = True
             self._show_dialog([
                 "你能听见吗？一种低沉的嗡鸣……就像记忆在胸腔里跳动。"
             ], title="心跳般的噪声")
-        if not self.archive_flags.get("boss_revealed") and dist <= max(20.0, self.archive_core_radius + 8.0):
+        if not self.archive_flags.get("boss_revealed") and dist_sq <= max(20.0, self.archive_core_radius + 8.0) ** 2:
             self.archive_flags["boss_revealed"] = True
             self._archive_spawn_boss()
             self._set_quest_stage("archive_boss")
@@ -2767,8 +2972,11 @@ class Game:
                     self.archive_minor_spawn_timer = random.uniform(4.0, 7.0)
                 else:
                     self.archive_minor_spawn_timer = 5.0
-        self._archive_update_boss(dt)
-        self._archive_update_projectiles(dt)
+        # exploration ticks skip the boss/projectile calls entirely
+        if self.archive_boss:
+            self._archive_update_boss(dt)
+        if self.archive_projectiles:
+            self._archive_update_projectiles(dt)
         self._archive_update_flashback(dt)
         if self.archive_flags.get("boss_revealed") and not self.archive_boss and not self.archive_flags.get("flash_started"):
             self.archive_flags["flash_started"] = True
@@ -2798,19 +3006,26 @@ class Game:
         if not width or not height:
             return False
         cell_size = self.map_data.cell_size
-        grid = self.map_data.collision_grid
+        mask = self._passable_mask
+        max_y = len(mask)
+        max_x = len(mask[0]) if max_y else 0
+        # sampling ring and centre are fixed for the whole rejection loop
+        r_min = self.archive_core_radius + 40.0
+        r_max = max(self.archive_warning_radius + 30.0, self.archive_core_radius + 80.0)
+        center_x, center_y = self.archive_center
+        uniform = random.uniform
         for _ in range(12):
-            angle = random.uniform(0.0, math.tau)
-            radius = random.uniform(self.archive_core_radius + 40.0, max(self.archive_warning_radius + 30.0, self.archive_core_radius + 80.0))
-            px = self.archive_center[0] + math.cos(angle) * radius
-            py = self.archive_center[1] + math.sin(angle) * radius
+            angle = uniform(0.0, math.tau)
+            radius = uniform(r_min, r_max)
+            px = center_x + math.cos(angle) * radius
+            py = center_y + math.sin(angle) * radius
             if not (0 <= px < width and 0 <= py < height):
                 continue
             gx = int(px // cell_size)
             gy = int(py // cell_size)
-            if gy < 0 or gy >= len(grid) or gx < 0 or gx >= len(grid[0]):
+            if gy < 0 or gy >= max_y or gx < 0 or gx >= max_x:
                 continue
-            if grid[gy][gx] not in settings.PASSABLE_VALUES:
+            if not mask[gy][gx]:
                 continue
             spawn = {
                 "x": float(px * self.map_scale),
@@ -2851,11 +3066,10 @@ class Game:
             "hit_radius": 78.0,
         }
         self.combat_active = True
-        self.archive_pulse_state.update({
-            "timer": 5.5,
-            "phase": "idle",
-            "applied": False,
-        })
+        pulse = self.archive_pulse_state
+        pulse.timer = 5.5
+        pulse.phase = "idle"
+        pulse.applied = False
 
     def _archive_spawn_support_minions(self) -> None:
         if not self.map_data:
@@ -2900,115 +3114,91 @@ class Game:
             else:
                 boss["fade"] = fade
             return
+        phase = boss.get("phase", 1)
+        angle = boss.get("angle", 0.0)
+        speed = 0.35 if phase == 1 else (0.52 if phase == 2 else 0.68)
+        angle = (angle + speed * dt) % math.tau
+        orbit = boss.get("orbit", 60.0)
+        center_x = self.archive_center[0] * self.map_scale
+        center_y = self.archive_center[1] * self.map_scale
+        boss["x"] = center_x + math.cos(angle) * orbit
+        boss["y"] = center_y + math.sin(angle) * orbit
+        boss["angle"] = angle
+        # phase, fire and pulse decisions run on a coarser tick with the accumulated dt;
+        # a lethal hit flushes the pending tick so phase transitions still fire before dying
+        hp = max(0.0, boss.get("hp", boss.get("max_hp", 1.0)))
+        ai_accum = boss.get("ai_accum", 0.0) + dt
+        if ai_accum >= settings.BOSS_AI_INTERVAL or hp <= 0.0:
+            boss["ai_accum"] = 0.0
+            self._archive_update_boss_ai(boss, ai_accum)
+        else:
+            boss["ai_accum"] = ai_accum
+        if hp <= 0.0 and boss.get("state") != "dying":
+            boss["state"] = "dying"
+            boss["fade"] = 1.2
+            self._archive_on_boss_defeated()
+
+    def _archive_update_boss_ai(self, boss: dict, dt: float) -> None:
         max_hp = boss.get("max_hp", 1.0)
         hp = max(0.0, boss.get("hp", max_hp))
         ratio = hp / max_hp if max_hp else 0.0
         phase = boss.get("phase", 1)
+        fire_timer = boss.get("fire_timer", 0.0)
         if ratio <= 0.66 and phase < 2 and not self.archive_flags.get("phase_two_started"):
             self.archive_flags["phase_two_started"] = True
-            boss["phase"] = 2
-            boss["fire_timer"] = min(boss.get("fire_timer", 3.5), 2.0)
+            phase = boss["phase"] = 2
+            fire_timer = min(fire_timer, 2.0)
             self._show_dialog([
                 "指引者：它开始呼叫碎片援军，准备迎战！"
             ], title="指引者")
             self._archive_spawn_support_minions()
-        if ratio <= 0.33 and boss.get("phase", 1) < 3 and not self.archive_flags.get("phase_three_started"):
+        if ratio <= 0.33 and phase < 3 and not self.archive_flags.get("phase_three_started"):
             self.archive_flags["phase_three_started"] = True
-            boss["phase"] = 3
+            phase = boss["phase"] = 3
             self._unlock_achievement("archive_phase_three")
-            boss["fire_timer"] = min(boss.get("fire_timer", 2.5), 1.5)
-            self.archive_pulse_state.update({
-                "timer": 4.0,
-                "interval": 5.0,
-                "warning": 1.2,
-                "duration": 0.9,
-                "phase": "idle",
-                "applied": False,
-            })
+            fire_timer = min(fire_timer, 1.5)
+            self.archive_pulse_state = PulseState(timer=4.0, interval=5.0, warning=1.2, duration=0.9)
             self._show_dialog([
                 "指引者：红色脉冲即将覆盖全场！躲到档案架后面！"
             ], title="警告")
-        angle = boss.get("angle", 0.0)
-        speed = 0.35 if boss.get("phase", 1) == 1 else (0.52 if boss.get("phase", 1) == 2 else 0.68)
-        angle = (angle + speed * dt) % math.tau
-        orbit = boss.get("orbit", 60.0)
-        center_x = self.archive_center[0] * self.map_scale
-        center_y = self.archive_center[1] * self.map_scale
-        boss["x"] = center_x + math.cos(angle) * orbit
-        boss["y"] = center_y + math.sin(angle) * orbit
-        boss["angle"] = angle
-        boss["fire_timer"] = max(0.0, boss.get("fire_timer", 0.0) - dt)
-        if boss["fire_timer"] <= 0.0:
-            px = self.player_rect.centerx
-            py = self.player_rect.centery
-            dir_angle = math.atan2(py - boss["y"], px - boss["x"])
-            phase = boss.get("phase", 1)
-            if phase == 1:
-                count = 3
-                spread = math.radians(20)
-                speed_px = 230.0
-                boss["fire_timer"] = 5.0
-            elif phase == 2:
-                count = 4
-                spread = math.radians(26)
-                speed_px = 260.0
-                boss["fire_timer"] = 4.0
-            else:
-                count = 5
-                spread = math.radians(32)
-                speed_px = 300.0
-                boss["fire_timer"] = 3.0
-            offsets = []
-            if count % 2 == 1:
-                half = count // 2
-                offsets = [i for i in range(-half, half + 1)]
-            else:
-                half = count // 2
-                offsets = [i for i in range(-half, half + 1) if i != 0]
-            for idx in offsets:
-                ang = dir_angle + idx * spread
-                vx = math.cos(ang) * speed_px
-                vy = math.sin(ang) * speed_px
-                self.archive_projectiles.append({
-                    "x": boss["x"],
-                    "y": boss["y"],
-                    "vx": vx,
-                    "vy": vy,
-                    "ttl": 3.5,
-                    "radius": 10,
-                    "color": (90, 210, 255),
-                    "damage": 18 if phase == 1 else (24 if phase == 2 else 30),
-                })
-        if boss.get("phase", 1) >= 3:
+        fire_timer = max(0.0, fire_timer - dt)
+        if fire_timer <= 0.0:
+            patterns = self._archive_fire_patterns
+            directions, speed_px, fire_timer, damage = patterns.get(phase, patterns[3])
+            bx = boss["x"]
+            by = boss["y"]
+            aim_x, aim_y = self._aim_velocity(bx, by, *self.player_rect.center, speed_px)
+            self.archive_projectiles.extend(
+                ArchiveProjectile(bx, by, aim_x * c - aim_y * s, aim_y * c + aim_x * s, 3.5, damage=damage)
+                for c, s in directions
+            )
+        boss["fire_timer"] = fire_timer
+        if phase >= 3:
             pulse = self.archive_pulse_state
-            pulse["timer"] = pulse.get("timer", 4.0) - dt
-            if pulse["phase"] == "idle" and pulse["timer"] <= 0.0:
-                pulse["phase"] = "warning"
-                pulse["timer"] = pulse.get("warning", 1.2)
-                pulse["applied"] = False
-            elif pulse["phase"] == "warning" and pulse["timer"] <= 0.0:
-                pulse["phase"] = "firing"
-                pulse["timer"] = pulse.get("duration", 0.9)
-            elif pulse["phase"] == "firing":
-                if not pulse.get("applied"):
+            timer = pulse.timer = pulse.timer - dt
+            pulse_phase = pulse.phase
+            if pulse_phase == "idle" and timer <= 0.0:
+                pulse.phase = "warning"
+                pulse.timer = pulse.warning
+                pulse.applied = False
+            elif pulse_phase == "warning" and timer <= 0.0:
+                pulse.phase = "firing"
+                pulse.timer = pulse.duration
+            elif pulse_phase == "firing":
+                if not pulse.applied:
                     self._archive_apply_pulse_damage()
-                    pulse["applied"] = True
-                if pulse["timer"] <= 0.0:
-                    pulse["phase"] = "idle"
-                    pulse["timer"] = pulse.get("interval", 5.0)
-                    pulse["applied"] = False
-        if hp <= 0.0 and boss.get("state") != "dying":
-            boss["state"] = "dying"
-            boss["fade"] = 1.2
-            self._archive_on_boss_defeated()
+                    pulse.applied = True
+                if timer <= 0.0:
+                    pulse.phase = "idle"
+                    pulse.timer = pulse.interval
+                    pulse.applied = False
 
     def _archive_apply_pulse_damage(self) -> None:
         px, py = self._player_map_pos()
         dx = px - self.archive_center[0]
         dy = py - self.archive_center[1]
-        dist = math.hypot(dx, dy)
         safe_radius = self.archive_core_radius + 36.0
-        in_pulse = dist <= safe_radius
+        in_pulse = dx * dx + dy * dy <= safe_radius * safe_radius
         if not in_pulse:
             if "pulse_cover_prompt" in self.archive_flags:
                 self.archive_flags.pop("pulse_cover_prompt", None)
@@ -3029,9 +3219,10 @@ class Game:
     def _archive_player_has_cover(self) -> bool:
         if not self.map_data:
             return False
-        grid = self.map_data.collision_grid
-        max_y = len(grid)
-        max_x = len(grid[0]) if max_y else 0
+        # the passable mask tracks the live grid (trap toggles included), one byte per cell
+        mask = self._passable_mask
+        max_y = len(mask)
+        max_x = len(mask[0]) if max_y else 0
         if not max_x or not max_y:
             return False
         cell_size = max(1, self.map_data.cell_size)
@@ -3050,14 +3241,8 @@ class Game:
         sy = 1 if y0 < y1 else -1
         err = dx + dy
         x, y = x0, y0
-        while True:
-            if not (x == x0 and y == y0) and not (x == x1 and y == y1):
-                if 0 <= x < max_x and 0 <= y < max_y:
-                    cell = grid[y][x]
-                    if cell not in settings.PASSABLE_VALUES:
-                        return True
-            if x == x1 and y == y1:
-                break
+        # step first so both endpoints are skipped without per-step endpoint tests
+        while x != x1 or y != y1:
             e2 = 2 * err
             if e2 >= dy:
                 err += dy
@@ -3065,39 +3250,47 @@ class Game:
             if e2 <= dx:
                 err += dx
                 y += sy
+            if x == x1 and y == y1:
+                break
+            if 0 <= x < max_x and 0 <= y < max_y and not mask[y][x]:
+                return True
         return False
 
     def _archive_update_projectiles(self, dt: float) -> None:
         if not self.archive_projectiles:
             return
-        next_proj: list[dict] = []
         if not self.map_data:
             self.archive_projectiles = []
             return
         grid = self.map_data.collision_grid
-        cell_px = self.map_data.cell_size * self.map_scale
+        cell_px = self._cell_px
         max_y = len(grid)
         max_x = len(grid[0]) if max_y else 0
-        player_radius = max(settings.PLAYER_SIZE) * 0.5
-        for proj in self.archive_projectiles:
-            ttl = proj.get("ttl", 0.0) - dt
+        player_radius = self._player_radius
+        # the player does not move during this pass, so its centre is read once
+        player_x, player_y = self.player_rect.center
+        projectiles = self.archive_projectiles
+        write = 0
+        for proj in projectiles:
+            ttl = proj.ttl - dt
             if ttl <= 0.0:
                 continue
-            proj["ttl"] = ttl
-            proj["x"] += proj.get("vx", 0.0) * dt
-            proj["y"] += proj.get("vy", 0.0) * dt
-            cx = int(proj["x"] // cell_px)
-            cy = int(proj["y"] // cell_px)
+            proj.ttl = ttl
+            x = proj.x = proj.x + proj.vx * dt
+            y = proj.y = proj.y + proj.vy * dt
+            cx = int(x // cell_px)
+            cy = int(y // cell_px)
             if cx < 0 or cy < 0 or cx >= max_x or cy >= max_y or grid[cy][cx] == 1:
                 continue
-            dx = proj["x"] - self.player_rect.centerx
-            dy = proj["y"] - self.player_rect.centery
-            radius = proj.get("radius", 10) + player_radius
+            dx = x - player_x
+            dy = y - player_y
+            radius = proj.radius + player_radius
             if dx * dx + dy * dy <= radius * radius:
-                self._apply_player_damage(proj.get("damage", 16.0))
+                self._apply_player_damage(proj.damage)
                 continue
-            next_proj.append(proj)
-        self.archive_projectiles = next_proj
+            projectiles[write] = proj
+            write += 1
+        del projectiles[write:]
 
     def _archive_on_boss_defeated(self) -> None:
         self.combat_active = bool(self.enemies)
@@ -3297,26 +3490,22 @@ class Game:
         ratio = hp / max_hp
         phase = int(state.get("boss_phase", 0))
         if ratio <= 0.75 and phase < 1:
-            state["boss_phase"] = 1
+            phase = state["boss_phase"] = 1
             self._show_dialog(["共鸣器情绪切换：悲伤。"], title="系统")
         elif ratio <= 0.5 and phase < 2:
-            state["boss_phase"] = 2
+            phase = state["boss_phase"] = 2
             self._show_dialog(["共鸣器情绪切换：恐惧。"], title="系统")
         elif ratio <= 0.25 and phase < 3:
-            state["boss_phase"] = 3
+            phase = state["boss_phase"] = 3
             self._show_dialog(["共鸣器情绪切换：愤怒。"], title="系统")
         mood_cycle = state.get("color_cycle", ["anger", "sadness", "fear"])
-        phase_index = int(state.get("boss_phase", 0))
-        if phase_index < 3:
-            state["active_mood"] = mood_cycle[min(phase_index, len(mood_cycle) - 1)]
-        else:
-            state["active_mood"] = mood_cycle[0]
-        state["boss_fire_timer"] = max(0.0, float(state.get("boss_fire_timer", 0.0)) - dt)
-        if state["boss_fire_timer"] <= 0.0:
-            mood = state.get("active_mood", mood_cycle[0])
-            state["active_mood"] = mood
+        mood = mood_cycle[min(phase, len(mood_cycle) - 1)] if phase < 3 else mood_cycle[0]
+        state["active_mood"] = mood
+        fire_timer = max(0.0, float(state.get("boss_fire_timer", 0.0)) - dt)
+        if fire_timer <= 0.0:
             self._resonator_spawn_attack(mood)
-            state["boss_fire_timer"] = 2.8 if mood == "sadness" else (2.2 if mood == "fear" else 1.8)
+            fire_timer = 2.8 if mood == "sadness" else (2.2 if mood == "fear" else 1.8)
+        state["boss_fire_timer"] = fire_timer
         flash_timer = float(state.get("boss_flash", 0.0))
         if flash_timer > 0.0:
             state["boss_flash"] = max(0.0, flash_timer - dt)
@@ -3332,22 +3521,8 @@ class Game:
         cy = center[1] * self.map_scale
         px = self.player_rect.centerx
         py = self.player_rect.centery
-        dir_angle = math.atan2(py - cy, px - cx)
-        if mood == "anger":
-            spread = math.radians(18)
-            speed_px = 360.0
-            damage = 26.0
-            radius = 10
-            slow = 0.0
-            offsets = [i for i in range(-2, 3)]
-        elif mood == "sadness":
-            spread = math.radians(14)
-            speed_px = 220.0
-            damage = 18.0
-            radius = 12
-            slow = 1.4
-            offsets = [i for i in range(-3, 4)]
-        else:
+        pattern = self._resonator_fire_patterns.get(mood)
+        if pattern is None:
             for _ in range(3):
                 offset = random.uniform(-50.0, 50.0)
                 target_x = px + offset
@@ -3362,48 +3537,52 @@ class Game:
                     "damage": 22.0,
                 })
             return
+        directions, speed_px, damage, radius, slow = pattern
         color = self._resonator_color(mood)
-        for idx in offsets:
-            ang = dir_angle + idx * spread
-            vx = math.cos(ang) * speed_px
-            vy = math.sin(ang) * speed_px
-            self.resonator_projectiles.append({
+        aim_x, aim_y = self._aim_velocity(cx, cy, px, py, speed_px)
+        self.resonator_projectiles.extend(
+            {
                 "kind": "bolt",
                 "x": cx,
                 "y": cy,
-                "vx": vx,
-                "vy": vy,
+                "vx": aim_x * c - aim_y * s,
+                "vy": aim_y * c + aim_x * s,
                 "ttl": 2.6,
                 "radius": radius,
                 "color": color,
                 "damage": damage,
                 "slow": slow,
-            })
+            }
+            for c, s in directions
+        )
 
     def _resonator_update_projectiles(self, dt: float) -> None:
         if not self.resonator_projectiles or not self.map_data:
             return
         grid = self.map_data.collision_grid
-        cell_px = self.map_data.cell_size * self.map_scale
+        cell_px = self._cell_px
         max_y = len(grid)
         max_x = len(grid[0]) if max_y else 0
-        player_radius = max(settings.PLAYER_SIZE) * 0.5
-        next_proj: list[dict] = []
-        for proj in self.resonator_projectiles:
+        player_radius = self._player_radius
+        # the player does not move during this pass, so its centre is read once
+        player_x, player_y = self.player_rect.center
+        projectiles = self.resonator_projectiles
+        write = 0
+        for proj in projectiles:
             kind = proj.get("kind", "bolt")
             if kind == "bolt":
                 ttl = proj.get("ttl", 0.0) - dt
                 if ttl <= 0.0:
                     continue
                 proj["ttl"] = ttl
-                proj["x"] += proj.get("vx", 0.0) * dt
-                proj["y"] += proj.get("vy", 0.0) * dt
-                cx = int(proj["x"] // cell_px)
-                cy = int(proj["y"] // cell_px)
+                x = proj["x"] = proj["x"] + proj.get("vx", 0.0) * dt
+                y = proj["y"] = proj["y"] + proj.get("vy", 0.0) * dt
+                cx = int(x // cell_px)
+                cy = int(y // cell_px)
                 if cx < 0 or cy < 0 or cx >= max_x or cy >= max_y or grid[cy][cx] == 1:
                     continue
-                dx = proj["x"] - self.player_rect.centerx
-                dy = proj["y"] - self.player_rect.centery
+                dx = x - player_x
+                dy = y - player_y
                 radius = proj.get("radius", 10) + player_radius
                 if dx * dx + dy * dy <= radius * radius:
                     self._apply_player_damage(proj.get("damage", 16.0))
@@ -3411,19 +3590,21 @@ class Game:
                     if slow > 0.0 and self.resonator_state:
                         self.resonator_state["slow_timer"] = max(float(self.resonator_state.get("slow_timer", 0.0)), slow)
                     continue
-                next_proj.append(proj)
+                projectiles[write] = proj
+                write += 1
             elif kind == "vortex":
                 timer = proj.get("timer", 0.0) - dt
                 if timer <= 0.0:
-                    dx = proj["x"] - self.player_rect.centerx
-                    dy = proj["y"] - self.player_rect.centery
+                    dx = proj["x"] - player_x
+                    dy = proj["y"] - player_y
                     radius = proj.get("radius", 36) + player_radius
                     if dx * dx + dy * dy <= radius * radius:
                         self._apply_player_damage(proj.get("damage", 18.0))
                     continue
                 proj["timer"] = timer
-                next_proj.append(proj)
-        self.resonator_projectiles = next_proj
+                projectiles[write] = proj
+                write += 1
+        del projectiles[write:]
 
     def _resonator_on_boss_defeated(self) -> None:
         if not self.resonator_state:
@@ -3486,12 +3667,15 @@ class Game:
         sy = int(my + oy)
         sprite = self.player_sprite or self._default_player_sprite()
         if sprite:
-            mirrored = pygame.transform.flip(sprite, True, False)
-            tinted = mirrored.copy()
-            tint = pygame.Surface(tinted.get_size(), pygame.SRCALPHA)
-            tint.fill((140, 210, 255, 210))
-            tinted.blit(tint, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
-            tinted.set_alpha(210)
+            # flip + tint once per source sprite, then reuse the finished surface every frame
+            if self._mirror_avatar_cache is None or self._mirror_avatar_cache[0] is not sprite:
+                tinted = pygame.transform.flip(sprite, True, False)
+                tint = pygame.Surface(tinted.get_size(), pygame.SRCALPHA)
+                tint.fill((140, 210, 255, 210))
+                tinted.blit(tint, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
+                tinted.set_alpha(210)
+                self._mirror_avatar_cache = (sprite, tinted)
+            tinted = self._mirror_avatar_cache[1]
             rect = tinted.get_rect(center=(sx, sy))
             self.screen.blit(tinted, rect)
         else:
@@ -3499,10 +3683,12 @@ class Game:
             pygame.draw.circle(self.screen, (150, 210, 255), (sx, sy), radius)
         state = self.mirror_state or {}
         if state.get("mirror_talk_ready"):
-            pulse = pygame.Surface((80, 80), pygame.SRCALPHA)
-            pygame.draw.circle(pulse, (120, 200, 255, 90), (40, 40), 36, width=3)
-            pygame.draw.circle(pulse, (120, 200, 255, 45), (40, 40), 28)
-            self.screen.blit(pulse, (sx - 40, sy - 40))
+            if self._mirror_pulse_surf is None:
+                pulse = pygame.Surface((80, 80), pygame.SRCALPHA)
+                pygame.draw.circle(pulse, (120, 200, 255, 90), (40, 40), 36, width=3)
+                pygame.draw.circle(pulse, (120, 200, 255, 45), (40, 40), 28)
+                self._mirror_pulse_surf = pulse
+            self.screen.blit(self._mirror_pulse_surf, (sx - 40, sy - 40))
 
     def _draw_mirror_boss_avatar(self, ox: int, oy: int) -> None:
         # Placeholder; full boss rendering handled alongside boss logic
@@ -3645,9 +3831,13 @@ class Game:
                 radius = int(proj.get("radius", 36))
                 timer = float(proj.get("timer", 0.0))
                 alpha = 140 if timer > 0.2 else 220
-                surf = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
-                color = proj.get("color", (140, 80, 180))
-                pygame.draw.circle(surf, (*color, alpha), (radius, radius), radius, width=2)
+                color = tuple(proj.get("color", (140, 80, 180)))
+                key = (radius, color, alpha)
+                surf = self._vortex_cache.get(key)
+                if surf is None:
+                    surf = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+                    pygame.draw.circle(surf, (*color, alpha), (radius, radius), radius, width=2)
+                    self._vortex_cache[key] = surf
                 self.screen.blit(surf, (int(proj["x"] + ox - radius), int(proj["y"] + oy - radius)))
             else:
                 sx = int(proj["x"] + ox)
@@ -3810,7 +4000,7 @@ class Game:
         if not path.exists():
             return None
         try:
-            sprite = pygame.image.load(str(path)).convert_alpha()
+            sprite = self._load_image(path)
         except Exception:
             return None
         if self.map_scale != 1:
@@ -3881,6 +4071,8 @@ class Game:
         grid = self.map_data.collision_grid
         base = self._base_collision_grid
         col_index = int(axis_col)
+        mask = self._passable_mask
+        lut = self._passable_lut
         for y, row in enumerate(grid):
             if col_index < 0 or col_index >= len(row):
                 continue
@@ -3891,6 +4083,9 @@ class Game:
                     row[col_index] = base[y][col_index]
                 else:
                     row[col_index] = 0
+            if y < len(mask):
+                mask[y][col_index] = lut[row[col_index]]
+        self._grid_version += 1
         self.mirror_state["axis_locked"] = bool(locked)
         if self.current_floor == "F15":
             self.nav_cache_player = pathfinding.build_nav_cache(
@@ -4001,8 +4196,8 @@ class Game:
         dist = math.hypot(dx, dy)
         if dist <= 80.0 or dist > 780.0:
             return False
-        cell_px = max(1, self.map_data.cell_size * self.map_scale)
-        steps = int(dist / max(1, cell_px // 2))
+        cell_px = self._cell_px
+        steps = int(dist / max(1, self._cell_half))
         if steps <= 0:
             return True
         grid = self.map_data.collision_grid
@@ -4024,7 +4219,7 @@ class Game:
         if not self.map_data:
             return
         move_speed = settings.PLAYER_SPEED * 0.95
-        cell_px = max(1, self.map_data.cell_size * self.map_scale)
+        cell_px = self._cell_px
         grid_w, grid_h = self.map_data.grid_size
         bx = float(state.get("boss_x", 0.0))
         by = float(state.get("boss_y", 0.0))
@@ -4102,17 +4297,7 @@ class Game:
             return
         vx = dx / dist * speed
         vy = dy / dist * speed
-        self.bullets.append({
-            "x": bx,
-            "y": by,
-            "vx": vx,
-            "vy": vy,
-            "ttl": ttl,
-            "radius": radius,
-            "color": (255, 150, 150),
-            "damage": damage,
-            "owner": "mirror_boss",
-        })
+        self._spawn_bullet(bx, by, vx, vy, ttl, radius, (255, 150, 150), damage, "mirror_boss")
 
     def _mirror_finish_boss(self) -> None:
         state = self.mirror_state
@@ -4420,6 +4605,15 @@ class Game:
             return scaled
         return sprite
 
+    def _load_image(self, path: Path) -> pygame.Surface:
+        # decode once per session; callers scale/rotate into new surfaces and never draw onto these
+        key = str(path)
+        image = self._image_cache.get(key)
+        if image is None:
+            image = pygame.image.load(key).convert_alpha()
+            self._image_cache[key] = image
+        return image
+
     def _apply_transparent_background(self, surface: pygame.Surface) -> pygame.Surface:
         if not surface:
             return surface
@@ -4589,13 +4783,43 @@ class Game:
             return preferred[0]
         return candidates[0] if candidates else None
 
+    def _load_fonts(self) -> None:
+        self.font_path = self._resolve_font()
+        self.font_prompt = self._load_font(18)
+        self.font_dialog = self._load_font(20)
+        self._cutscene_hint_surf = self.font_prompt.render("点击任意键继续", True, settings.DIALOG_TEXT)
+        # position inside the cutscene dialog panel (bottom-right corner)
+        self._cutscene_hint_pos = (
+            self._cutscene_strip.width - self._cutscene_hint_surf.get_width() - self._cutscene_pad,
+            self._cutscene_strip.height - self._cutscene_hint_surf.get_height() - settings.DIALOG_PADDING,
+        )
+
     def _load_font(self, size: int) -> pygame.font.Font:
-        if hasattr(self, "font_path") and self.font_path and self.font_path.exists():
+        font_path = getattr(self, "font_path", None)
+        key = (font_path, size)
+        font = self._font_cache.get(key)
+        if font is not None:
+            return font
+        font = None
+        if font_path and font_path.exists():
             try:
-                return pygame.font.Font(str(self.font_path), size)
+                font = pygame.font.Font(str(font_path), size)
             except Exception:
                 pass
-        return pygame.font.SysFont(settings.UI_FONT_NAME, size)
+        if font is None:
+            font = pygame.font.SysFont(settings.UI_FONT_NAME, size)
+        self._font_cache[key] = font
+        return font
+
+    def _render_cached(self, font: pygame.font.Font, text: str, color: tuple) -> pygame.Surface:
+        key = (id(font), text, tuple(color))
+        surf = self._text_cache.get(key)
+        if surf is None:
+            if len(self._text_cache) >= settings.TEXT_RENDER_CACHE_SIZE:
+                self._text_cache.clear()
+            surf = font.render(text, True, color)
+            self._text_cache[key] = surf
+        return surf
 
     def _map_coords_from_screen(self, pos: tuple[int, int]) -> tuple[int, int]:
         x, y = pos
@@ -4613,7 +4837,7 @@ class Game:
         if not (0 <= map_x < map_w and 0 <= map_y < map_h):
             return
         # Convert to grid
-        cell = self.map_data.cell_size * self.map_scale
+        cell = self._cell_px
         start = (self.player_rect.centerx // cell, self.player_rect.centery // cell)
         goal = (int(map_x) // cell, int(map_y) // cell)
         self._start_click_feedback(map_x, map_y)
@@ -4645,8 +4869,8 @@ class Game:
                 )
                 if len(path_nodes) > 1:
                     goal = nearest
-                    map_x = goal[0] * cell + cell // 2
-                    map_y = goal[1] * cell + cell // 2
+                    map_x = goal[0] * cell + self._cell_half
+                    map_y = goal[1] * cell + self._cell_half
 
         self.path = path_nodes[1:] if len(path_nodes) > 1 else []
         self.path_target = (map_x, map_y) if self.path else None
@@ -4663,7 +4887,7 @@ class Game:
             collider,
             (dx, dy),
             self.map_data.collision_grid,
-            cell_size=self.map_data.cell_size * self.map_scale,
+            cell_size=self._cell_px,
             substep=settings.COLLISION_SUBSTEP,
         )
         # move visual rect to keep relative offset
@@ -4675,36 +4899,27 @@ class Game:
         # WASD/arrow with cancellation rules; speed matches auto-path (player_move_speed)
         if self.player_dead:
             return (0, 0)
-        def held(key_codes: tuple[int, ...]) -> bool:
-            return any(keys[kc] for kc in key_codes if kc < len(keys)) or any((kc in self._keys_down) for kc in key_codes)
-
-        left = self._held_dirs["left"] or held((pygame.K_a, pygame.K_LEFT))
-        right = self._held_dirs["right"] or held((pygame.K_d, pygame.K_RIGHT))
-        up = self._held_dirs["up"] or held((pygame.K_w, pygame.K_UP))
-        down = self._held_dirs["down"] or held((pygame.K_s, pygame.K_DOWN))
+        held = self._held_dirs
+        key_count = len(keys)
+        for kc, bit in self._dir_keys.items():
+            if (kc < key_count and keys[kc]) or kc in self._keys_down:
+                held |= bit
+        x_bits = held & 3
+        y_bits = held >> 2
 
         # conflict lock: if both pressed, axis stays 0 until both released
-        if left and right:
+        if x_bits == 3:
             self._conflict_x = True
-        if up and down:
-            self._conflict_y = True
-        if not left and not right:
+        elif not x_bits:
             self._conflict_x = False
-        if not up and not down:
+        if y_bits == 3:
+            self._conflict_y = True
+        elif not y_bits:
             self._conflict_y = False
 
-        vx = 0
-        vy = 0
-        if not self._conflict_x:
-            if left:
-                vx = -1
-            elif right:
-                vx = 1
-        if not self._conflict_y:
-            if up:
-                vy = -1
-            elif down:
-                vy = 1
+        # axis value per 2-bit pattern: none, negative, positive, both (locked above)
+        vx = 0 if self._conflict_x else (0, -1, 1, 0)[x_bits]
+        vy = 0 if self._conflict_y else (0, -1, 1, 0)[y_bits]
 
         if vx == 0 and vy == 0:
             return 0, 0
@@ -4807,31 +5022,11 @@ class Game:
             angle = base_angle + random.uniform(-spread_rad, spread_rad)
             vx = math.cos(angle) * speed
             vy = math.sin(angle) * speed
-            self.bullets.append({
-                "x": float(px),
-                "y": float(py),
-                "vx": vx,
-                "vy": vy,
-                "ttl": ttl,
-                "radius": radius,
-                "color": color,
-                "damage": damage,
-                "owner": "player",
-            })
+            self._spawn_bullet(float(px), float(py), vx, vy, ttl, radius, color, damage)
             if mirror_sync and mirror_pos:
                 mx, my = mirror_pos
-                self.bullets.append({
-                    "x": float(mx),
-                    "y": float(my),
-                    "vx": -vx,
-                    "vy": vy,
-                    "ttl": ttl,
-                    "radius": radius,
-                    "color": (150, 210, 255),
-                    "damage": damage,
-                    "owner": "mirror",
-                    "axis_side": 1 if mx >= self._mirror_axis_x_scaled() else -1,
-                })
+                axis_side = 1 if mx >= self._mirror_axis_x_scaled() else -1
+                self._spawn_bullet(float(mx), float(my), -vx, vy, ttl, radius, (150, 210, 255), damage, "mirror", axis_side)
         self.ammo_in_clip -= 1
         self.weapon_ammo[self.current_weapon] = self.ammo_in_clip
         self.fire_cooldown = float(weapon_cfg.get("fire_cooldown", settings.GUN_FIRE_COOLDOWN))
@@ -4849,45 +5044,92 @@ class Game:
                 clip_size = self._weapon_clip_size(self.current_weapon)
                 self.ammo_in_clip = clip_size
                 self.weapon_ammo[self.current_weapon] = clip_size
-        cell_px = self.map_data.cell_size * self.map_scale
+        cell_px = self._cell_px
         max_y = len(self.map_data.collision_grid)
         max_x = len(self.map_data.collision_grid[0]) if max_y else 0
-        next_bullets: list[dict] = []
-        for b in self.bullets:
+        grid = self.map_data.collision_grid
+        mirror_floor = self.current_floor == "F15"
+        # enemies that can still be hit; filtered once per frame instead of once per bullet
+        live_enemies = [enemy for enemy in self.enemies if enemy.get("state") != "dying"]
+        # bucket them by position so each bullet only tests its own and the 8 neighbouring buckets
+        bucket_size = settings.ENEMY_HIT_BUCKET_SIZE
+        enemy_buckets: dict[tuple[int, int], list[tuple[int, dict]]] = {}
+        enemy_count = len(live_enemies)
+        if self.bullets:
+            for order, enemy in enumerate(live_enemies):
+                key = (int(enemy["x"] // bucket_size), int(enemy["y"] // bucket_size))
+                enemy_buckets.setdefault(key, []).append((order, enemy))
+        enemy_radius = settings.ENEMY_RADIUS
+        default_radius = settings.GUN_BULLET_RADIUS
+        default_damage = settings.PLAYER_BULLET_DAMAGE
+        player_x, player_y = self.player_rect.center
+        # the resonator core does not move, so its hit circle is resolved once per frame
+        resonator_target: tuple[float, float, float] | None = None
+        if self.current_floor == "F25" and self.resonator_state and self.resonator_state.get("boss_state") != "defeated":
+            center = self.resonator_state.get("center", (0.0, 0.0))
+            sprite = self.resonator_assets.get("resonator_core_placeholder")
+            if sprite:
+                core_radius = max(sprite.get_width(), sprite.get_height()) * 0.45
+            else:
+                core_radius = 30.0
+            resonator_target = (center[0] * self.map_scale, center[1] * self.map_scale, core_radius)
+        # survivors are swapped to the front in order; spent bullets collect behind `write`
+        bullets = self.bullets
+        write = 0
+        for index, b in enumerate(bullets):
             b["ttl"] -= dt
             if b["ttl"] <= 0:
                 continue
-            b["x"] += b["vx"] * dt
-            b["y"] += b["vy"] * dt
+            bx = b["x"] + b["vx"] * dt
+            by = b["y"] + b["vy"] * dt
+            b["x"] = bx
+            b["y"] = by
             owner = b.get("owner", "player")
-            if self.current_floor == "F15":
+            if mirror_floor:
                 if owner == "mirror" and self._mirror_bullet_crossed_axis(b):
                     continue
                 if owner == "mirror_boss":
-                    dx_p = b["x"] - self.player_rect.centerx
-                    dy_p = b["y"] - self.player_rect.centery
-                    bullet_radius = float(b.get("radius", settings.GUN_BULLET_RADIUS))
-                    hit_radius = bullet_radius + max(settings.PLAYER_SIZE) * 0.5
+                    dx_p = bx - player_x
+                    dy_p = by - player_y
+                    bullet_radius = float(b.get("radius", default_radius))
+                    hit_radius = bullet_radius + self._player_radius
                     if dx_p * dx_p + dy_p * dy_p <= hit_radius * hit_radius:
-                        self._apply_player_damage(float(b.get("damage", settings.PLAYER_BULLET_DAMAGE)))
+                        self._apply_player_damage(float(b.get("damage", default_damage)))
                         continue
             # enemy hit check
             if owner in {"player", "mirror"}:
                 hit_enemy = None
-                bullet_radius = float(b.get("radius", settings.GUN_BULLET_RADIUS))
-                hit_radius_sq = (settings.ENEMY_RADIUS + bullet_radius) ** 2
-                for enemy in self.enemies:
-                    if enemy.get("state") == "dying":
-                        continue
-                    dx = enemy["x"] - b["x"]
-                    dy = enemy["y"] - b["y"]
-                    if dx * dx + dy * dy <= hit_radius_sq:
-                        hit_enemy = enemy
-                        break
+                bullet_radius = float(b.get("radius", default_radius))
+                hit_radius_sq = (enemy_radius + bullet_radius) ** 2
+                if enemy_radius + bullet_radius <= bucket_size:
+                    # first enemy in list order still wins, as with a plain scan
+                    hit_order = enemy_count
+                    bcx = int(bx // bucket_size)
+                    bcy = int(by // bucket_size)
+                    for key in (
+                        (bcx - 1, bcy - 1), (bcx, bcy - 1), (bcx + 1, bcy - 1),
+                        (bcx - 1, bcy), (bcx, bcy), (bcx + 1, bcy),
+                        (bcx - 1, bcy + 1), (bcx, bcy + 1), (bcx + 1, bcy + 1),
+                    ):
+                        for order, enemy in enemy_buckets.get(key, ()):
+                            if order >= hit_order or enemy.get("state") == "dying":
+                                continue
+                            dx = enemy["x"] - bx
+                            dy = enemy["y"] - by
+                            if dx * dx + dy * dy <= hit_radius_sq:
+                                hit_order = order
+                                hit_enemy = enemy
+                else:
+                    for enemy in live_enemies:
+                        dx = enemy["x"] - bx
+                        dy = enemy["y"] - by
+                        if dx * dx + dy * dy <= hit_radius_sq:
+                            hit_enemy = enemy
+                            break
                 if hit_enemy:
                     max_hp = float(hit_enemy.get("max_hp", settings.ENEMY_MAX_HEALTH))
                     current_hp = float(hit_enemy.get("hp", max_hp))
-                    damage = float(b.get("damage", settings.PLAYER_BULLET_DAMAGE))
+                    damage = float(b.get("damage", default_damage))
                     current_hp = max(0.0, current_hp - damage)
                     hit_enemy["hp"] = current_hp
                     hit_enemy["max_hp"] = max_hp
@@ -4900,56 +5142,78 @@ class Game:
                         hit_enemy["state"] = "dying"
                         hit_enemy["fade_timer"] = settings.ENEMY_FADE_DURATION
                         hit_enemy["attack_anim_timer"] = 0.0
+                        live_enemies.remove(hit_enemy)
                     continue  # bullet consumed on hit
 
             if owner == "player" and self.archive_boss and self.archive_boss.get("state") != "dying":
-                dx_b = self.archive_boss.get("x", 0.0) - b["x"]
-                dy_b = self.archive_boss.get("y", 0.0) - b["y"]
+                dx_b = self.archive_boss.get("x", 0.0) - bx
+                dy_b = self.archive_boss.get("y", 0.0) - by
                 radius = self.archive_boss.get("hit_radius", 78.0) + bullet_radius
                 if dx_b * dx_b + dy_b * dy_b <= radius * radius:
-                    damage = float(b.get("damage", settings.PLAYER_BULLET_DAMAGE))
+                    damage = float(b.get("damage", default_damage))
                     hp = max(0.0, float(self.archive_boss.get("hp", 0.0)) - damage)
                     self.archive_boss["hp"] = hp
                     self.archive_boss["flash"] = 0.12
                     continue
 
-            if owner == "player" and self.current_floor == "F25" and self.resonator_state and self.resonator_state.get("boss_state") != "defeated":
-                center = self.resonator_state.get("center", (0.0, 0.0))
-                cx = center[0] * self.map_scale
-                cy = center[1] * self.map_scale
-                sprite = self.resonator_assets.get("resonator_core_placeholder")
-                if sprite:
-                    hit_radius = max(sprite.get_width(), sprite.get_height()) * 0.45
-                else:
-                    hit_radius = 30.0
-                dx_b = cx - b["x"]
-                dy_b = cy - b["y"]
-                radius = hit_radius + bullet_radius
+            if owner == "player" and resonator_target:
+                res_x, res_y, core_radius = resonator_target
+                dx_b = res_x - bx
+                dy_b = res_y - by
+                radius = core_radius + bullet_radius
                 if dx_b * dx_b + dy_b * dy_b <= radius * radius:
                     if self.resonator_state.get("boss_state") == "dormant":
                         self._resonator_start_boss()
-                    damage = float(b.get("damage", settings.PLAYER_BULLET_DAMAGE))
+                    damage = float(b.get("damage", default_damage))
                     hp = max(0.0, float(self.resonator_state.get("boss_hp", 0.0)) - damage)
                     self.resonator_state["boss_hp"] = hp
                     self.resonator_state["boss_flash"] = 0.12
                     continue
-            if owner == "player" and self.current_floor == "F15":
+            if owner == "player" and mirror_floor:
                 if self._mirror_bullet_hits_sync(b):
                     continue
                 if self._mirror_bullet_hits_boss(b):
                     continue
 
-            cx = int(b["x"] // cell_px)
-            cy = int(b["y"] // cell_px)
+            cx = int(bx // cell_px)
+            cy = int(by // cell_px)
             if cx < 0 or cy < 0 or cx >= max_x or cy >= max_y:
                 continue
-            if self.map_data.collision_grid[cy][cx] == 1:
-                if owner == "player" and self.current_floor == "F15" and self._mirror_axis_cell(cx):
-                    next_bullets.append(b)
-                    continue
+            if grid[cy][cx] == 1 and not (owner == "player" and mirror_floor and self._mirror_axis_cell(cx)):
                 continue
-            next_bullets.append(b)
-        self.bullets = next_bullets
+            bullets[index] = bullets[write]
+            bullets[write] = b
+            write += 1
+        if write != len(bullets):
+            self._bullet_pool.extend(bullets[write:])
+            del bullets[write:]
+
+    def _spawn_bullet(
+        self,
+        x: float,
+        y: float,
+        vx: float,
+        vy: float,
+        ttl: float,
+        radius: int,
+        color: tuple[int, int, int],
+        damage: float,
+        owner: str = "player",
+        axis_side: int = 0,
+    ) -> None:
+        # reuse a spent bullet dict when one is available; every key is rewritten
+        b = self._bullet_pool.pop() if self._bullet_pool else {}
+        b["x"] = x
+        b["y"] = y
+        b["vx"] = vx
+        b["vy"] = vy
+        b["ttl"] = ttl
+        b["radius"] = radius
+        b["color"] = color
+        b["damage"] = damage
+        b["owner"] = owner
+        b["axis_side"] = axis_side
+        self.bullets.append(b)
 
     def _apply_player_damage(self, amount: float) -> None:
         if amount <= 0 or self.player_dead:
@@ -5018,7 +5282,9 @@ class Game:
             return
         if not self.map_data:
             return
-        remaining: list[dict] = []
+        # survivors are compacted in place (write index trails the read) instead of rebuilt
+        enemies = self.enemies
+        write = 0
         removed_any = False
         any_aggro = False
         px, py = self.player_rect.center
@@ -5032,24 +5298,26 @@ class Game:
         target_cell: tuple[int, int] | None = None
         grid_w = grid_h = 0
         if use_astar:
-            cell_px = max(1, int(self.map_data.cell_size * self.map_scale))
+            cell_px = self._cell_px
             grid_w, grid_h = self.map_data.grid_size
             target_cell = (
                 max(0, min(grid_w - 1, int(px // cell_px))),
                 max(0, min(grid_h - 1, int(py // cell_px))),
             )
-        for enemy in self.enemies:
-            enemy.setdefault("hp", float(settings.ENEMY_MAX_HEALTH))
-            enemy.setdefault("max_hp", float(settings.ENEMY_MAX_HEALTH))
-            enemy.setdefault("state", "idle")
-            enemy.setdefault("aggro", False)
-            enemy.setdefault("show_health", 0.0)
-            enemy.setdefault("attack_timer", random.uniform(0.1, settings.ENEMY_ATTACK_COOLDOWN))
-            enemy.setdefault("attack_anim_timer", 0.0)
-            if use_astar:
+        for enemy in enemies:
+            # defaults are filled once; "attack_timer" is always present afterwards
+            if "attack_timer" not in enemy:
+                enemy.setdefault("hp", float(settings.ENEMY_MAX_HEALTH))
+                enemy.setdefault("max_hp", float(settings.ENEMY_MAX_HEALTH))
+                enemy.setdefault("state", "idle")
+                enemy.setdefault("aggro", False)
+                enemy.setdefault("show_health", 0.0)
+                enemy["attack_timer"] = random.uniform(0.1, settings.ENEMY_ATTACK_COOLDOWN)
+                enemy.setdefault("attack_anim_timer", 0.0)
+            if use_astar and "path_timer" not in enemy:
                 enemy.setdefault("path", [])
                 enemy.setdefault("path_goal", None)
-                enemy.setdefault("path_timer", random.uniform(0.2, 0.4))
+                enemy["path_timer"] = random.uniform(0.2, 0.4)
             if enemy.get("flash_timer", 0.0) > 0.0:
                 enemy["flash_timer"] = max(0.0, enemy["flash_timer"] - dt)
             if enemy.get("show_health", 0.0) > 0.0:
@@ -5060,7 +5328,8 @@ class Game:
                 if fade <= 0.0:
                     removed_any = True
                     continue
-                remaining.append(enemy)
+                enemies[write] = enemy
+                write += 1
                 continue
 
             aggro_radius = float(enemy.get("aggro_radius", settings.ENEMY_AGGRO_RADIUS))
@@ -5093,7 +5362,8 @@ class Game:
             if not aggro:
                 enemy["state"] = "idle"
                 enemy["attack_timer"] = max(0.0, enemy.get("attack_timer", 0.0) - dt)
-                remaining.append(enemy)
+                enemies[write] = enemy
+                write += 1
                 continue
 
             any_aggro = True
@@ -5120,8 +5390,9 @@ class Game:
                 enemy["flash_timer"] = settings.ENEMY_ATTACK_FLASH_TIME
                 self._spawn_enemy_attack_fx(enemy)
 
-            remaining.append(enemy)
-        self.enemies = remaining
+            enemies[write] = enemy
+            write += 1
+        del enemies[write:]
         self.any_enemy_aggro = any_aggro
         if removed_any and not self.enemies and self.combat_active:
             self._on_enemies_cleared()
@@ -5136,7 +5407,7 @@ class Game:
             collider,
             (dx, dy),
             self.map_data.collision_grid,
-            cell_size=self.map_data.cell_size * self.map_scale,
+            cell_size=self._cell_px,
             substep=settings.COLLISION_SUBSTEP,
         )
         enemy["x"] = float(moved.centerx)
@@ -5212,14 +5483,16 @@ class Game:
     def _update_enemy_attack_fx(self, dt: float) -> None:
         if not self.enemy_attack_fx:
             return
-        active: list[dict] = []
-        for fx in self.enemy_attack_fx:
+        effects = self.enemy_attack_fx
+        write = 0
+        for fx in effects:
             timer = fx.get("timer", 0.0) - dt
             if timer <= 0.0:
                 continue
             fx["timer"] = timer
-            active.append(fx)
-        self.enemy_attack_fx = active
+            effects[write] = fx
+            write += 1
+        del effects[write:]
 
     def _draw_enemy_attack_fx(self) -> None:
         if not self.enemy_attack_fx:
@@ -5301,7 +5574,8 @@ class Game:
                 return
         base_x, base_y = self.player_rect.center
         grid_w, grid_h = self.map_data.grid_size
-        cell_px = self.map_data.cell_size * self.map_scale
+        cell_px = self._cell_px
+        cell_half = self._cell_half
         start_cell = (
             max(0, min(grid_w - 1, int(base_x // cell_px))),
             max(0, min(grid_h - 1, int(base_y // cell_px))),
@@ -5323,8 +5597,8 @@ class Game:
             if not spawn_cell:
                 continue
             taken_cells.add(spawn_cell)
-            cx = spawn_cell[0] * cell_px + cell_px // 2
-            cy = spawn_cell[1] * cell_px + cell_px // 2
+            cx = spawn_cell[0] * cell_px + cell_half
+            cy = spawn_cell[1] * cell_px + cell_half
             spawned.append({
                 "x": float(cx),
                 "y": float(cy),
@@ -5346,12 +5620,11 @@ class Game:
                     break
                 if cell in taken_cells:
                     continue
-                dist_start = abs(cell[0] - start_cell[0]) + abs(cell[1] - start_cell[1])
-                if dist_start == 0:
+                if cell == start_cell:
                     continue
                 taken_cells.add(cell)
-                cx = cell[0] * cell_px + cell_px // 2
-                cy = cell[1] * cell_px + cell_px // 2
+                cx = cell[0] * cell_px + cell_half
+                cy = cell[1] * cell_px + cell_half
                 spawned.append({
                     "x": float(cx),
                     "y": float(cy),
@@ -5379,8 +5652,8 @@ class Game:
                 if self.map_data.collision_grid[cell[1]][cell[0]] not in settings.PASSABLE_VALUES:
                     continue
                 taken_cells.add(cell)
-                cx = cell[0] * cell_px + cell_px // 2
-                cy = cell[1] * cell_px + cell_px // 2
+                cx = cell[0] * cell_px + cell_half
+                cy = cell[1] * cell_px + cell_half
                 spawned.append({
                     "x": float(cx),
                     "y": float(cy),
@@ -5406,8 +5679,10 @@ class Game:
         cells_y = max(1, (settings.PLAYER_SIZE[1] + cell_size - 1) // cell_size)
         radius_x = (cells_x - 1) // 2
         radius_y = (cells_y - 1) // 2
+        stride = len(grid[0]) if grid else 0
+        visited = bytearray(stride * len(grid))
+        visited[start_cell[1] * stride + start_cell[0]] = 1
         queue: deque[tuple[tuple[int, int], int]] = deque([(start_cell, 0)])
-        visited: set[tuple[int, int]] = {start_cell}
         cells: list[tuple[int, int]] = [start_cell]
         while queue:
             (cx, cy), depth = queue.popleft()
@@ -5421,9 +5696,10 @@ class Game:
                 radius_x=radius_x,
                 radius_y=radius_y,
             ):
-                if (nx, ny) in visited:
+                idx = ny * stride + nx
+                if visited[idx]:
                     continue
-                visited.add((nx, ny))
+                visited[idx] = 1
                 queue.append(((nx, ny), depth + 1))
                 cells.append((nx, ny))
         return cells
@@ -5437,10 +5713,14 @@ class Game:
     ) -> tuple[int, int] | None:
         best_cell: tuple[int, int] | None = None
         best_score = 1_000_000
+        desired_x, desired_y = desired_cell
         for cell in accessible_cells:
             if cell in taken_cells:
                 continue
-            dist = abs(cell[0] - desired_cell[0]) + abs(cell[1] - desired_cell[1])
+            cx, cy = cell
+            dist = (cx - desired_x if cx >= desired_x else desired_x - cx) + (
+                cy - desired_y if cy >= desired_y else desired_y - cy
+            )
             if dist > max_distance:
                 continue
             if dist < best_score:
@@ -5461,21 +5741,24 @@ class Game:
         cell_size = max(1, int(self.map_data.cell_size))
         start_x = max(0, min(max_x - 1, int(px // cell_size)))
         start_y = max(0, min(max_y - 1, int(py // cell_size)))
-        if grid[start_y][start_x] in settings.PASSABLE_VALUES:
+        mask = self._passable_mask
+        if mask[start_y][start_x]:
             return (start_x, start_y)
-        visited = {(start_x, start_y)}
+        visited = bytearray(max_x * max_y)
+        visited[start_y * max_x + start_x] = 1
         queue = deque([(start_x, start_y, 0)])
         while queue:
             cx, cy, steps = queue.popleft()
             if steps >= max_steps:
                 continue
             for nx, ny in ((cx + 1, cy), (cx - 1, cy), (cx, cy + 1), (cx, cy - 1)):
-                if (nx, ny) in visited:
-                    continue
                 if 0 <= nx < max_x and 0 <= ny < max_y:
-                    if grid[ny][nx] in settings.PASSABLE_VALUES:
+                    idx = ny * max_x + nx
+                    if visited[idx]:
+                        continue
+                    if mask[ny][nx]:
                         return (nx, ny)
-                    visited.add((nx, ny))
+                    visited[idx] = 1
                     queue.append((nx, ny, steps + 1))
         return None
 
@@ -5538,11 +5821,8 @@ class Game:
                 alpha = 210
             if alpha_scale != 1.0:
                 alpha = max(0, min(255, int(alpha * alpha_scale)))
-            surf = pygame.Surface((draw_r * 2, draw_r * 2), pygame.SRCALPHA)
-            pygame.draw.circle(surf, (*color, alpha), (draw_r, draw_r), draw_r)
-            if state == "attacking":
-                pygame.draw.circle(surf, (255, 255, 255, alpha), (draw_r, draw_r), draw_r, width=2)
-            self.screen.blit(surf, (sx - draw_r, sy - draw_r))
+            outline = (255, 255, 255, alpha) if state == "attacking" else None
+            self.screen.blit(self._disc_sprite((*color, alpha), draw_r, outline=outline), (sx - draw_r, sy - draw_r))
             self._draw_enemy_health_bar(enemy, sx, sy)
         for enemy in self.enemies:
             sx = int(enemy["x"] + ox)
@@ -5583,39 +5863,82 @@ class Game:
         if not self.bullets:
             return
         ox, oy = self.map_offset
+        disc = self._disc_sprite
+        blits = []
         for b in self.bullets:
-            sx = int(b["x"] + ox)
-            sy = int(b["y"] + oy)
             r = int(b.get("radius", settings.GUN_BULLET_RADIUS))
-            color = b.get("color", settings.GUN_BULLET_COLOR)
-            pygame.draw.circle(self.screen, color, (sx, sy), r)
+            blits.append((disc(b.get("color", settings.GUN_BULLET_COLOR), r), (int(b["x"] + ox) - r, int(b["y"] + oy) - r)))
+        self.screen.blits(blits, doreturn=False)
+
+    def _fan_directions(self, count: int, spread: float) -> tuple[tuple[float, float], ...]:
+        # symmetric fan around the aim as (cos, sin) of each offset; even counts leave the
+        # centre line empty. Rotating these by the aim costs one cos/sin pair per volley.
+        half = count // 2
+        return tuple(
+            (math.cos(i * spread), math.sin(i * spread))
+            for i in range(-half, half + 1)
+            if count % 2 or i != 0
+        )
+
+    def _aim_velocity(self, x0: float, y0: float, x1: float, y1: float, speed: float) -> tuple[float, float]:
+        # velocity of length `speed` from (x0, y0) towards (x1, y1), without trig; a zero-length
+        # aim points along +x, as atan2(0, 0) did
+        dx = x1 - x0
+        dy = y1 - y0
+        dist = math.hypot(dx, dy)
+        if dist == 0.0:
+            return speed, 0.0
+        scale = speed / dist
+        return dx * scale, dy * scale
+
+    def _disc_sprite(self, color: tuple[int, ...], radius: int, *, outline: tuple[int, ...] | None = None) -> pygame.Surface:
+        # circle of `radius` centred in a (2r+1)^2 surface; blitting it at (x - r, y - r)
+        # matches pygame.draw.circle at (x, y)
+        key = (color, radius, outline)
+        surf = self._disc_cache.get(key)
+        if surf is None:
+            if len(self._disc_cache) > 512:
+                self._disc_cache.clear()
+            surf = pygame.Surface((radius * 2 + 1, radius * 2 + 1), pygame.SRCALPHA)
+            pygame.draw.circle(surf, color, (radius, radius), radius)
+            if outline:
+                pygame.draw.circle(surf, outline, (radius, radius), radius, width=2)
+            self._disc_cache[key] = surf
+        return surf
 
     def _follow_path(self, dt: float) -> bool:
         if not self.map_data or not self.path:
             return False
-        cell_px = self.map_data.cell_size * self.map_scale
+        cell_px = self._cell_px
+        cell_half = self._cell_half
         next_node = self.path[0]
-        target_pos = (next_node[0] * cell_px + cell_px // 2, next_node[1] * cell_px + cell_px // 2)
-        vx = target_pos[0] - self.player_rect.centerx
-        vy = target_pos[1] - self.player_rect.centery
-        dist = max(1, (vx * vx + vy * vy) ** 0.5)
-        speed = self.player_move_speed * dt
-        dx = int(round(vx / dist * speed))
-        dy = int(round(vy / dist * speed))
+        target_pos = (next_node[0] * cell_px + cell_half, next_node[1] * cell_px + cell_half)
         before = self.player_rect.center
+        vx = target_pos[0] - before[0]
+        vy = target_pos[1] - before[1]
+        speed = self.player_move_speed * dt
+        # reuse the segment direction while the last step landed where it was aimed and the
+        # target is still more than one step ahead; otherwise re-aim from the current position
+        cached = self._path_dir_cache
+        if cached and cached[0] == target_pos and cached[3] == before and vx * cached[1] + vy * cached[2] > speed:
+            ux, uy = cached[1], cached[2]
+        else:
+            dist = max(1.0, math.hypot(vx, vy))
+            ux, uy = vx / dist, vy / dist
+        dx = int(round(ux * speed))
+        dy = int(round(uy * speed))
+        self._path_dir_cache = (target_pos, ux, uy, (before[0] + dx, before[1] + dy))
         moved_step = self._move_player(dx, dy)
         after = self.player_rect.center
-        # If we failed to get closer (collision), try skipping the node or replanning to goal
-        prev_dist = abs(before[0] - target_pos[0]) + abs(before[1] - target_pos[1])
-        new_dist = abs(after[0] - target_pos[0]) + abs(after[1] - target_pos[1])
-        no_progress = new_dist >= prev_dist and after == before
-        if no_progress:
+        # If we failed to move (collision), try skipping the node or replanning to goal
+        if after == before:
+            self._path_dir_cache = None
             self.path.pop(0)
             if not self.path:
                 self._replan_to_goal()
                 return moved_step
             next_node = self.path[0]
-            target_pos = (next_node[0] * cell_px + cell_px // 2, next_node[1] * cell_px + cell_px // 2)
+            target_pos = (next_node[0] * cell_px + cell_half, next_node[1] * cell_px + cell_half)
 
         if abs(self.player_rect.centerx - target_pos[0]) <= cell_px // 3 and abs(self.player_rect.centery - target_pos[1]) <= cell_px // 3:
             self.path.pop(0)
@@ -5627,7 +5950,7 @@ class Game:
     def _replan_to_goal(self) -> None:
         if not self.map_data or not self.path_goal_cell:
             return
-        cell = self.map_data.cell_size * self.map_scale
+        cell = self._cell_px
         start = (self.player_rect.centerx // cell, self.player_rect.centery // cell)
         goal = self.path_goal_cell
         path_nodes = self._lab_astar(
@@ -5654,30 +5977,82 @@ class Game:
             return
         size = settings.MINIMAP_SIZE
         pad = settings.MINIMAP_MARGIN
-        mini = pygame.Surface((size, size))
-        mini.fill(settings.MINIMAP_BG)
         grid_w, grid_h = self.map_data.grid_size
         scale = min(size / grid_w, size / grid_h)
-        cell_w = max(1, int(scale))
-        for y, row in enumerate(self.map_data.collision_grid):
-            for x, val in enumerate(row):
-                if val in settings.PASSABLE_VALUES:
-                    pygame.draw.rect(mini, settings.MINIMAP_WALKABLE, (int(x * scale), int(y * scale), cell_w, cell_w))
+        if self._minimap_cache is None or self._minimap_cache[0] != self._grid_version:
+            self._minimap_cache = (self._grid_version, self._build_minimap_base(scale))
+        mini = self._minimap_cache[1].copy()
         # Player marker
-        cell = self.map_data.cell_size * self.map_scale
+        cell = self._cell_px
         px = int(self.player_rect.centerx / cell * scale)
         py = int(self.player_rect.centery / cell * scale)
         pygame.draw.circle(mini, settings.MINIMAP_PLAYER, (px, py), max(2, int(scale)))
         self.screen.blit(mini, (pad, pad))
 
+    def _build_minimap_base(self, scale: float) -> pygame.Surface:
+        size = settings.MINIMAP_SIZE
+        mini = pygame.Surface((size, size))
+        mini.fill(settings.MINIMAP_BG)
+        grid_w, grid_h = self.map_data.grid_size
+        if not self._passable_mask or grid_w <= 0 or grid_h <= 0:
+            return mini
+        # a pixel is walkable when any walkable cell's int(scale)-wide square covers it, so
+        # one-cell corridors survive downscaling. Rows are OR-merged as packed ints (byte i =
+        # cell i); a shifted OR then gives each pixel's column window, read with one map().
+        cell_w = max(1, int(scale))
+        col_spans = self._minimap_spans(grid_w, scale, cell_w, size)
+        row_spans = self._minimap_spans(grid_h, scale, cell_w, size)
+        lengths = sorted({hi - lo for lo, hi in col_spans if hi > lo})
+        window_base = {length: i * grid_w for i, length in enumerate(lengths)}
+        empty = len(lengths) * grid_w  # trailing zero byte read by uncovered pixels
+        picks = [window_base[hi - lo] + lo if hi > lo else empty for lo, hi in col_spans]
+        packed = [int.from_bytes(row, "little") for row in self._passable_mask]
+        pixels = bytearray()
+        for lo, hi in row_spans:
+            merged = 0
+            for line in packed[lo:hi]:
+                merged |= line
+            windows = bytearray()
+            for length in lengths:
+                window = merged
+                for k in range(1, length):
+                    window |= merged >> (8 * k)
+                windows += window.to_bytes(grid_w, "little")
+            windows.append(0)
+            pixels += bytes(map(windows.__getitem__, picks))
+        # mask bytes double as palette indices: 0 -> background, 1 -> walkable
+        cells = pygame.image.frombuffer(bytes(pixels), (len(col_spans), len(row_spans)), "P")
+        cells.set_palette([settings.MINIMAP_BG, settings.MINIMAP_WALKABLE])
+        mini.blit(cells, (0, 0))
+        return mini
+
+    def _minimap_spans(self, count: int, scale: float, cell_w: int, size: int) -> list[tuple[int, int]]:
+        # per minimap pixel, the [lo, hi) range of grid cells whose square covers it
+        out = min(size, int((count - 1) * scale) + cell_w)
+        lo = [count] * out
+        hi = [0] * out
+        for i in range(count):
+            start = int(i * scale)
+            for p in range(start, min(start + cell_w, out)):
+                if i < lo[p]:
+                    lo[p] = i
+                hi[p] = i + 1
+        return [(a, b) if a < b else (0, 0) for a, b in zip(lo, hi)]
+
     # --- Interaction helpers ---
     def _interaction_zones(self) -> list[dict]:
+        # zones are static per floor; scale them once and reuse the list every frame
+        key = (self.current_floor, self.map_scale)
+        cached = self._interaction_zone_cache
+        if cached is not None and cached[0] == key:
+            return cached[1]
         zones = settings.INTERACT_ZONES.get(self.current_floor, [])
         scale = self.map_scale
         scaled: list[dict] = []
         for z in zones:
             x1, y1, x2, y2 = z["rect"]
             scaled.append({**z, "rect": (int(x1 * scale), int(y1 * scale), int(x2 * scale), int(y2 * scale))})
+        self._interaction_zone_cache = (key, scaled)
         return scaled
 
     def _interaction_allowed(self, trig: dict) -> bool:
@@ -5937,6 +6312,7 @@ class Game:
         self.dialog_lines = lines
         self.dialog_title = title
         self.dialog_timer = settings.DIALOG_LIFETIME
+        self._dialog_render_cache = None
 
     def _dismiss_dialog(self) -> None:
         if not self.dialog_lines:
@@ -5946,11 +6322,13 @@ class Game:
         self.dialog_lines = []
         self.dialog_timer = 0.0
         self.dialog_title = ""
+        self._dialog_render_cache = None
 
     def _show_ambient_dialog(self, lines: list[str], *, title: str = "", lifetime: float = 5.0) -> None:
         self.ambient_dialog_lines = lines
         self.ambient_dialog_title = title
         self.ambient_dialog_timer = max(0.0, float(lifetime))
+        self._ambient_render_cache = None
 
     def _dismiss_ambient_dialog(self) -> None:
         if not self.ambient_dialog_lines:
@@ -5960,6 +6338,7 @@ class Game:
         self.ambient_dialog_lines = []
         self.ambient_dialog_timer = 0.0
         self.ambient_dialog_title = ""
+        self._ambient_render_cache = None
 
     def _update_dialog(self, dt: float) -> None:
         if self.dialog_timer > 0:
@@ -5977,7 +6356,7 @@ class Game:
         if not self.interaction_target:
             return
         text = self._prompt_text_for_trigger(self.interaction_target)
-        surf = self.font_prompt.render(text, True, settings.PROMPT_TEXT)
+        surf = self._render_cached(self.font_prompt, text, settings.PROMPT_TEXT)
         pad = 6
         bg_rect = surf.get_rect()
         bg_rect.width += pad * 2
@@ -5990,44 +6369,50 @@ class Game:
     def _draw_dialog(self) -> None:
         if not self.dialog_lines:
             return
-        overlay_h = int(settings.WINDOW_HEIGHT * settings.DIALOG_OVERLAY_HEIGHT_RATIO)
-        overlay = pygame.Surface((settings.WINDOW_WIDTH, overlay_h), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, settings.DIALOG_OVERLAY_ALPHA))
-        self.screen.blit(overlay, (0, settings.WINDOW_HEIGHT - overlay_h))
-
-        title_text = self.dialog_title or ""
-        y_base = settings.WINDOW_HEIGHT - overlay_h + settings.DIALOG_PADDING + 8
-        pad_x = settings.DIALOG_PADDING + 12
-        if title_text:
-            title_surf = self.font_dialog.render(title_text, True, settings.TITLE_GLOW_COLOR)
-            self.screen.blit(title_surf, (pad_x, y_base))
-            y_base += title_surf.get_height() + 10
-        line_gap = 6
-        for line in self.dialog_lines:
-            ln_surf = self.font_dialog.render(line, True, settings.DIALOG_TEXT)
-            self.screen.blit(ln_surf, (pad_x, y_base))
-            y_base += ln_surf.get_height() + line_gap
+        key = (id(self.dialog_lines), self.dialog_title, id(self.font_dialog))
+        if self._dialog_render_cache is None or self._dialog_render_cache[0] != key:
+            panel = self._build_dialog_panel(self.dialog_title or "", self.dialog_lines)
+            self._dialog_render_cache = (key, panel)
+        self._blit_dialog_panel(self._dialog_render_cache[1])
 
     def _draw_ambient_dialog(self) -> None:
         if self.dialog_lines or not self.ambient_dialog_lines:
             return
+        key = (id(self.ambient_dialog_lines), self.ambient_dialog_title, id(self.font_dialog))
+        if self._ambient_render_cache is None or self._ambient_render_cache[0] != key:
+            panel = self._build_dialog_panel(self.ambient_dialog_title or "", self.ambient_dialog_lines)
+            self._ambient_render_cache = (key, panel)
+        self._blit_dialog_panel(self._ambient_render_cache[1])
+
+    def _blit_dialog_panel(self, panel: pygame.Surface) -> None:
+        # darken the strip, then lay the cached glyphs over it: the same order as drawing them directly
+        overlay = self._dialog_overlay
+        if overlay is None or overlay.get_height() != panel.get_height():
+            overlay = pygame.Surface(panel.get_size(), pygame.SRCALPHA)
+            overlay.fill((0, 0, 0, settings.DIALOG_OVERLAY_ALPHA))
+            self._dialog_overlay = overlay
+        y = settings.WINDOW_HEIGHT - panel.get_height()
+        self.screen.blit(overlay, (0, y))
+        self.screen.blit(panel, (0, y))
+
+    def _build_dialog_panel(self, title_text: str, lines: list[str]) -> pygame.Surface:
+        # compose title + lines once; the panel is reused until the dialog changes.
+        # Text only on a transparent panel: RGBA_MAX copies glyph pixels without darkening
+        # their edges, so blitting it over the overlay matches drawing the glyphs directly
         overlay_h = int(settings.WINDOW_HEIGHT * settings.DIALOG_OVERLAY_HEIGHT_RATIO)
-        overlay = pygame.Surface((settings.WINDOW_WIDTH, overlay_h), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, settings.DIALOG_OVERLAY_ALPHA))
-        self.screen.blit(overlay, (0, settings.WINDOW_HEIGHT - overlay_h))
-
-        title_text = self.ambient_dialog_title or ""
-        y_base = settings.WINDOW_HEIGHT - overlay_h + settings.DIALOG_PADDING + 8
+        panel = pygame.Surface((settings.WINDOW_WIDTH, overlay_h), pygame.SRCALPHA)
+        y_base = settings.DIALOG_PADDING + 8
         pad_x = settings.DIALOG_PADDING + 12
         if title_text:
             title_surf = self.font_dialog.render(title_text, True, settings.TITLE_GLOW_COLOR)
-            self.screen.blit(title_surf, (pad_x, y_base))
+            panel.blit(title_surf, (pad_x, y_base), special_flags=pygame.BLEND_RGBA_MAX)
             y_base += title_surf.get_height() + 10
         line_gap = 6
-        for line in self.ambient_dialog_lines:
+        for line in lines:
             ln_surf = self.font_dialog.render(line, True, settings.DIALOG_TEXT)
-            self.screen.blit(ln_surf, (pad_x, y_base))
+            panel.blit(ln_surf, (pad_x, y_base), special_flags=pygame.BLEND_RGBA_MAX)
             y_base += ln_surf.get_height() + line_gap
+        return panel
 
     def _draw_debug_coords(self) -> None:
         # Show player map coordinates in bottom-right for debugging
@@ -6036,7 +6421,7 @@ class Game:
         px = int(self.player_rect.centerx / self.map_scale)
         py = int(self.player_rect.centery / self.map_scale)
         text = f"({px}, {py})"
-        surf = self.font_prompt.render(text, True, settings.PROMPT_TEXT)
+        surf = self._render_cached(self.font_prompt, text, settings.PROMPT_TEXT)
         margin = 10
         pos = (settings.WINDOW_WIDTH - surf.get_width() - margin, settings.WINDOW_HEIGHT - surf.get_height() - margin)
         bg = pygame.Surface((surf.get_width() + 6, surf.get_height() + 6))
@@ -6054,7 +6439,7 @@ class Game:
         x = margin
         y = margin + settings.MINIMAP_SIZE + 8
         # measure width
-        surf_lines = [self.font_prompt.render(txt, True, settings.QUEST_TEXT) for txt in lines]
+        surf_lines = [self._render_cached(self.font_prompt, txt, settings.QUEST_TEXT) for txt in lines]
         max_w = max((s.get_width() for s in surf_lines), default=0)
         box_w = max_w + pad * 2
         box_h = sum(s.get_height() for s in surf_lines) + pad * 2 + (len(surf_lines) - 1) * 4
@@ -6151,7 +6536,7 @@ class Game:
             pygame.draw.rect(self.screen, settings.PLAYER_HEALTH_BAR_COLOR, fill_rect)
         pygame.draw.rect(self.screen, settings.PLAYER_HEALTH_BAR_BORDER, bg_rect, 1)
         hp_text = f"HP {int(math.ceil(current))}/{int(max_hp)}"
-        label = self.font_prompt.render(hp_text, True, settings.QUEST_TEXT)
+        label = self._render_cached(self.font_prompt, hp_text, settings.QUEST_TEXT)
         label_x = max(8, x - label.get_width() - 12)
         label_y = y + (height - label.get_height()) // 2
         self.screen.blit(label, (label_x, label_y))
@@ -6171,15 +6556,21 @@ class Game:
         if avoid_rect and y < avoid_rect.bottom + 6:
             shift = (avoid_rect.bottom + 6) - y
             y += shift
-        last_rect = pygame.Rect(x, y, 0, 0)
-        for i in range(total):
-            rect = pygame.Rect(x + i * (size + gap), y, size, size * 2)
-            if i < filled:
-                pygame.draw.rect(self.screen, color_on, rect, border_radius=3)
-            else:
-                pygame.draw.rect(self.screen, color_off, rect, width=1, border_radius=3)
-            last_rect = rect
-        return last_rect
+        if total <= 0:
+            return pygame.Rect(x, y, 0, 0)
+        key = (total, filled, tuple(color_on))
+        panel = self._ammo_cached[1]
+        if self._ammo_cached[0] != key or panel is None:
+            panel = pygame.Surface((total * (size + gap) - gap, size * 2), pygame.SRCALPHA)
+            for i in range(total):
+                rect = pygame.Rect(i * (size + gap), 0, size, size * 2)
+                if i < filled:
+                    pygame.draw.rect(panel, color_on, rect, border_radius=3)
+                else:
+                    pygame.draw.rect(panel, color_off, rect, width=1, border_radius=3)
+            self._ammo_cached = (key, panel)
+        self.screen.blit(panel, (x, y))
+        return pygame.Rect(x + (total - 1) * (size + gap), y, size, size * 2)
 
     def _draw_reload_bar(self, ammo_rect: pygame.Rect | None = None) -> None:
         if self.reload_timer <= 0:
@@ -6282,8 +6673,7 @@ class Game:
             pygame.draw.rect(self.screen, col, (x, y, rw, rh))
         if fade_text:
             text = "//BOOT_SEQUENCE_INITIATED..."
-            surf = self.font_prompt.render(text, True, settings.TITLE_GLOW_COLOR)
-            surf.set_alpha(255)
+            surf = self._render_cached(self.font_prompt, text, settings.TITLE_GLOW_COLOR)
             rect = surf.get_rect(center=(settings.WINDOW_WIDTH // 2, settings.WINDOW_HEIGHT // 2))
             self.screen.blit(surf, rect)
 
@@ -6299,11 +6689,17 @@ class Game:
             base = self.map_surface
             w, h = base.get_size()
             block = max(3, int(32 * (1.0 - progress) + 2))
-            small_w = max(1, w // block)
-            small_h = max(1, h // block)
-            mosaic = pygame.transform.scale(base, (small_w, small_h))
-            mosaic = pygame.transform.scale(mosaic, (w, h))
-            self.screen.blit(mosaic, offset)
+            if self._mosaic_cache is None or self._mosaic_cache[0] != block:
+                if not self._mosaic_pyramid:
+                    self._mosaic_pyramid = self._build_mosaic_pyramid(base)
+                # downsample from the smallest pre-halved level that still covers the target size
+                level = min(len(self._mosaic_pyramid) - 1, block.bit_length() - 1)
+                small_w = max(1, w // block)
+                small_h = max(1, h // block)
+                mosaic = pygame.transform.scale(self._mosaic_pyramid[level], (small_w, small_h))
+                mosaic = pygame.transform.scale(mosaic, (w, h))
+                self._mosaic_cache = (block, mosaic)
+            self.screen.blit(self._mosaic_cache[1], offset)
         # draw player faded
         player_screen_pos = (settings.WINDOW_WIDTH // 2, settings.WINDOW_HEIGHT // 2)
         alpha = int(max(0, min(1.0, player_alpha)) * 255)
@@ -6317,44 +6713,66 @@ class Game:
             rect.fill((*settings.PLAYER_COLOR, alpha))
             self.screen.blit(rect, (player_screen_pos[0] - settings.PLAYER_SIZE[0] // 2, player_screen_pos[1] - settings.PLAYER_SIZE[1] // 2))
 
+    def _build_mosaic_pyramid(self, base: pygame.Surface) -> list[pygame.Surface]:
+        levels = [base]
+        w, h = base.get_size()
+        while min(w, h) >= 16:
+            w //= 2
+            h //= 2
+            levels.append(pygame.transform.scale(levels[-1], (w, h)))
+        return levels
+
     # --- Cutscene / Guided dialog ---
     def _start_guidance_cutscene(self) -> None:
         self.cutscene_started = True
         self.cutscene_on_complete = "boot"
-        self.cutscene_lines = [
-            {"speaker": "指引者", "text": "系统上线。欢迎回来，清除异常。正在初始化环境扫描..."},
-            {"speaker": "指引者", "text": "检测到数据冗余，已清理。"},
-            {"speaker": "指引者", "text": "起身校准体感：WASD/方向键移动，鼠标左键或空格射击，F 交互，R 装填。"},
-            {"speaker": "指引者", "text": "需要导航时，右键点击地面会自动规划路径，按方向键随时打断并手动控制。"},
-            {"speaker": "指引者", "text": "靠近终端或电梯按 F 交互，准星指向目标即可自动锁定射击。"},
-            {"speaker": "指引者", "text": "别忘了切换到英文输入法，否则快捷键会失效。准备好了就开始行动。"},
-        ]
+        self.cutscene_lines = settings.GUIDANCE_CUTSCENE_LINES
         self.cutscene_idx = 0
         self.cutscene_char_progress = 0.0
+        self.cutscene_shown_len = 0
         self.cutscene_done_line = False
         self.cutscene_active = True
-
-    def _current_cutscene_line(self) -> dict | None:
-        if 0 <= self.cutscene_idx < len(self.cutscene_lines):
-            return self.cutscene_lines[self.cutscene_idx]
-        return None
+        self._index_cutscene_lines()
+        self._prepare_cutscene_line()
+
+    def _index_cutscene_lines(self) -> None:
+        # flatten the script into parallel per-line tables so per-frame code indexes tuples, not dicts
+        texts = tuple(text for _, text in self.cutscene_lines)
+        speaker_ids: dict[str, int] = {}
+        for speaker, _ in self.cutscene_lines:
+            speaker_ids.setdefault(speaker, len(speaker_ids))
+        self._cutscene_speaker_ids = tuple(speaker_ids[speaker] for speaker, _ in self.cutscene_lines)
+        self._cutscene_texts = texts
+        self._cutscene_text_lens = tuple(len(text) for text in texts)
+        self._cutscene_cps_table = tuple(
+            max(settings.DIALOG_TYPE_SPEED_MIN, max(1, len(text)) / settings.DIALOG_TYPE_MAX_DURATION)
+            for text in texts
+        )
+        font = self.font_dialog
+        self._speaker_surf_by_id = [
+            font.render(speaker, True, settings.TITLE_GLOW_COLOR) for speaker in speaker_ids
+        ]
+        # the script is short: rasterize and measure every line up front so advancing only swaps references
+        self._cutscene_line_surfs = [font.render(text, True, settings.DIALOG_TEXT) if text else None for text in texts]
+        self._cutscene_line_offsets = [self._cumulative_advances(font, text) for text in texts]
+        self._cutscene_last_state = None
+        self._cutscene_composed = None
 
     def _advance_cutscene(self) -> None:
         if not self.cutscene_active:
             return
-        line = self._current_cutscene_line()
-        if not line:
+        if not 0 <= self.cutscene_idx < len(self._cutscene_texts):
             self.cutscene_active = False
             return
-        text = line.get("text", "")
         if not self.cutscene_done_line:
             # skip typing to full
-            self.cutscene_char_progress = len(text)
+            self.cutscene_char_progress = self._cutscene_text_lens[self.cutscene_idx]
+            self.cutscene_shown_len = self._cutscene_text_lens[self.cutscene_idx]
             self.cutscene_done_line = True
             return
         # move to next line
         self.cutscene_idx += 1
-        if self.cutscene_idx >= len(self.cutscene_lines):
+        if self.cutscene_idx >= len(self._cutscene_texts):
             self.cutscene_active = False
             mode = self.cutscene_on_complete
             self.cutscene_on_complete = ""
@@ -6365,56 +6783,88 @@ class Game:
                 self._floor0_on_cutscene_end()
             return
         self.cutscene_char_progress = 0.0
+        self.cutscene_shown_len = 0
         self.cutscene_done_line = False
+        self._prepare_cutscene_line()
+
+    def _prepare_cutscene_line(self) -> None:
+        idx = self.cutscene_idx
+        if not 0 <= idx < len(self._cutscene_texts):
+            self._cutscene_line_surf = None
+            self._cutscene_char_x = array("i", [0])
+            return
+        self._cutscene_line_surf = self._cutscene_line_surfs[idx]
+        self._cutscene_char_x = self._cutscene_line_offsets[idx]
+        self._cutscene_text_len = self._cutscene_text_lens[idx]
+        self._cutscene_cps = self._cutscene_cps_table[idx]
+
+    def _cumulative_advances(self, font: pygame.font.Font, text: str) -> array:
+        # prefix pixel widths from one metrics() pass; offsets[i] is the x where character i starts
+        offsets = array("i", [0])
+        x = 0
+        for i, metric in enumerate(font.metrics(text)):
+            if metric is None:
+                x = font.size(text[: i + 1])[0]
+            else:
+                x += metric[4]
+            offsets.append(x)
+        return offsets
 
     def _update_cutscene(self, dt: float) -> None:
-        line = self._current_cutscene_line()
-        if not line:
+        if self.cutscene_done_line or not self.cutscene_active:
+            return
+        if not 0 <= self.cutscene_idx < len(self._cutscene_texts):
             self.cutscene_active = False
             return
-        text = line.get("text", "")
-        length = max(1, len(text))
-        cps = max(settings.DIALOG_TYPE_SPEED_MIN, length / settings.DIALOG_TYPE_MAX_DURATION)
-        if not self.cutscene_done_line:
-            self.cutscene_char_progress += cps * dt
-            if self.cutscene_char_progress >= len(text):
-                self.cutscene_char_progress = len(text)
-                self.cutscene_done_line = True
+        # typing speed and length are baked per line in _prepare_cutscene_line; work on locals
+        length = self._cutscene_text_len
+        progress = self.cutscene_char_progress + self._cutscene_cps * dt
+        if progress >= length:
+            self.cutscene_char_progress = length
+            self.cutscene_shown_len = length
+            self.cutscene_done_line = True
+            return
+        self.cutscene_char_progress = progress
+        shown = int(progress)
+        if shown != self.cutscene_shown_len:
+            self.cutscene_shown_len = shown
 
     def _set_quest_stage(self, stage: str) -> None:
         self.quest_stage = stage
-        if stage in {"elevator", "lab_exit", "resonator_log", "resonator_exit", "mirror_exit", "sanctuary_exit", "sanctuary_done"}:
-            self.elevator_locked = False
-        if stage in {"intro", "explore", "combat", "log", "lab_intro", "lab_cleanup",
-                     "resonator_intro", "resonator_talk", "resonator_boss", "mirror_intro",
-                     "mirror_cleanup", "mirror_talk", "sanctuary_find", "sanctuary_agent",
-                     "floor0_awaken", "floor0_done"}:
-            self.elevator_locked = True
+        self.elevator_locked = settings.QUEST_ELEVATOR_LOCKED.get(stage, self.elevator_locked)
 
     def _draw_cutscene_dialog(self) -> None:
-        line = self._current_cutscene_line()
-        if not line:
-            return
-        speaker = line.get("speaker", "")
-        text = line.get("text", "")
-        shown_len = int(self.cutscene_char_progress) if not self.cutscene_done_line else len(text)
-        shown_text = text[:shown_len]
-        overlay_h = int(settings.WINDOW_HEIGHT * settings.DIALOG_OVERLAY_HEIGHT_RATIO)
-        overlay = pygame.Surface((settings.WINDOW_WIDTH, overlay_h), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, settings.DIALOG_OVERLAY_ALPHA))
-        self.screen.blit(overlay, (0, settings.WINDOW_HEIGHT - overlay_h))
-
-        pad = settings.DIALOG_PADDING + 8
-        y_base = settings.WINDOW_HEIGHT - overlay_h + pad
+        idx = self.cutscene_idx
+        if not 0 <= idx < len(self._cutscene_texts):
+            return
+        strip = self._cutscene_strip
+        # darken the strip in place: multiplying by (255 - alpha) matches a black overlay at that alpha
+        # without reading a full-width RGBA source surface every frame
+        self.screen.fill(self._cutscene_shade, strip, special_flags=pygame.BLEND_RGB_MULT)
+        state = (idx, self.cutscene_shown_len, self.cutscene_done_line)
+        if state != self._cutscene_last_state or self._cutscene_composed is None:
+            panel = self._compose_cutscene_dialog(idx)
+            self._cutscene_composed = (panel, panel.get_bounding_rect())
+            self._cutscene_last_state = state
+        # unchanged line/progress -> the previous frame's composite is still exact
+        panel, content = self._cutscene_composed
+        self.screen.blit(panel, (content.x, strip.y + content.y), content)
+
+    def _compose_cutscene_dialog(self, idx: int) -> pygame.Surface:
+        # text only on a transparent panel; RGBA_MAX copies glyph pixels without darkening their edges
+        panel = pygame.Surface(self._cutscene_strip.size, pygame.SRCALPHA)
+        shown_len = self.cutscene_shown_len
+        pad = self._cutscene_pad
         # speaker
-        speaker_surf = self.font_dialog.render(speaker, True, settings.TITLE_GLOW_COLOR)
-        self.screen.blit(speaker_surf, (pad, y_base))
+        speaker_surf = self._speaker_surf_by_id[self._cutscene_speaker_ids[idx]]
+        panel.blit(speaker_surf, (pad, pad), special_flags=pygame.BLEND_RGBA_MAX)
         # text (wrap simple by splitting) but single line for now
-        text_surf = self.font_dialog.render(shown_text, True, settings.DIALOG_TEXT)
-        self.screen.blit(text_surf, (pad, y_base + speaker_surf.get_height() + 8))
+        text_surf = self._cutscene_line_surf
+        if text_surf and shown_len > 0:
+            # the full line is rendered once per line; typing only widens the visible area
+            shown_w = self._cutscene_char_x[min(shown_len, len(self._cutscene_char_x) - 1)]
+            area = pygame.Rect(0, 0, shown_w, text_surf.get_height())
+            panel.blit(text_surf, (pad, pad + speaker_surf.get_height() + 8), area, special_flags=pygame.BLEND_RGBA_MAX)
         if self.cutscene_done_line:
-            hint = "点击任意键继续"
-            hint_surf = self.font_prompt.render(hint, True, settings.DIALOG_TEXT)
-            hint_x = settings.WINDOW_WIDTH - hint_surf.get_width() - pad
-            hint_y = settings.WINDOW_HEIGHT - overlay_h + overlay_h - hint_surf.get_height() - settings.DIALOG_PADDING
-            self.screen.blit(hint_surf, (hint_x, hint_y))
+            panel.blit(self._cutscene_hint_surf, self._cutscene_hint_pos, special_flags=pygame.BLEND_RGBA_MAX)
+        return panel
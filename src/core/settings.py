@@ -172,6 +172,8 @@ ENEMY_HEALTH_BAR_BG = (30, 34, 45)
 ENEMY_HEALTH_BAR_COLOR = (255, 150, 170)
 ENEMY_HEALTH_BAR_BORDER = (250, 250, 255)
 ENEMY_HEALTH_BAR_VIS_DURATION = 2.0
+ENEMY_HIT_BUCKET_SIZE = 64  # spatial hash cell (px) for bullet hit tests; keep >= enemy + bullet radius
+BOSS_AI_INTERVAL = 1 / 20  # seconds between boss phase/fire/pulse decisions; motion stays per-frame
 
 # Lab (F40) abstract layout colors
 LAB_WALL_COLOR = (12, 16, 24)
@@ -264,15 +266,40 @@ DIALOG_OVERLAY_ALPHA = 180
 DIALOG_OVERLAY_HEIGHT_RATIO = 0.33
 DIALOG_TYPE_SPEED_MIN = 14  # chars per second minimum
 DIALOG_TYPE_MAX_DURATION = 2.0  # seconds per line cap
+TEXT_RENDER_CACHE_SIZE = 256  # rendered text surfaces kept before the cache is flushed
 
 # Quest / tasks
 QUEST_BG = (0, 0, 0, 140)
 QUEST_TEXT = (220, 230, 240)
 QUEST_TITLE = (150, 200, 255)
+# Elevator lock state applied when a quest stage is entered; stages not listed keep the current lock
+QUEST_ELEVATOR_LOCKED = {
+    **dict.fromkeys(
+        ("elevator", "lab_exit", "resonator_log", "resonator_exit", "mirror_exit", "sanctuary_exit", "sanctuary_done"),
+        False,
+    ),
+    **dict.fromkeys(
+        ("intro", "explore", "combat", "log", "lab_intro", "lab_cleanup",
+         "resonator_intro", "resonator_talk", "resonator_boss", "mirror_intro",
+         "mirror_cleanup", "mirror_talk", "sanctuary_find", "sanctuary_agent",
+         "floor0_awaken", "floor0_done"),
+        True,
+    ),
+}
 DIALOG_LIFETIME = 4.0
 PLAYER_HIT_FLASH_TIME = 0.25
 PLAYER_HIT_FLASH_COLOR = (255, 80, 120, 140)
 
+# Guidance cutscene after the boot intro: (speaker, text) pairs
+GUIDANCE_CUTSCENE_LINES = (
+    ("指引者", "系统上线。欢迎回来，清除异常。正在初始化环境扫描..."),
+    ("指引者", "检测到数据冗余，已清理。"),
+    ("指引者", "起身校准体感：WASD/方向键移动，鼠标左键或空格射击，F 交互，R 装填。"),
+    ("指引者", "需要导航时，右键点击地面会自动规划路径，按方向键随时打断并手动控制。"),
+    ("指引者", "靠近终端或电梯按 F 交互，准星指向目标即可自动锁定射击。"),
+    ("指引者", "别忘了切换到英文输入法，否则快捷键会失效。准备好了就开始行动。"),
+)
+
 # Achievements (story-progress milestones; no rewards attached)
 ACHIEVEMENTS = [
     {"id": "boot_sequence", "title": "系统重启", "desc": "完成启动序列与引导，进入行动阶段。"},
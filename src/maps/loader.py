@@ -10,7 +10,7 @@ from typing import Any, List
 
 @dataclass
 class MapData:
-    collision_grid: List[List[int]]
+    collision_grid: List[bytearray]
     cell_size: int
     grid_size: tuple[int, int]
     tile_size: int
@@ -29,7 +29,8 @@ def load_map(path: str | Path, *, base_dir: Path | None = None) -> MapData:
     with p.open("r", encoding="utf-8") as f:
         data = json.load(f)
 
-    grid = data["collision_grid"]
+    # one byte per cell: compact rows with C-level indexing and cheap copies
+    grid = [bytearray(row) for row in data["collision_grid"]]
     cell_size = int(data.get("cell_size", data.get("tile_size", 64)))
     width = len(grid[0]) if grid else 0
     height = len(grid) if grid else 0
@@ -7,18 +7,20 @@ Vec2 = Tuple[int, int]
 
 
 def rect_collides_with_grid(rect: pygame.Rect, collision_grid: Iterable[Iterable[int]], cell_size: int) -> bool:
-    rows = list(collision_grid)
+    # the map grid is already a list of rows; only copy other iterables
+    rows = collision_grid if isinstance(collision_grid, list) else list(collision_grid)
     max_y = len(rows)
     max_x = len(rows[0]) if max_y else 0
     left = max(rect.left // cell_size, 0)
     right = min((rect.right - 1) // cell_size, max_x - 1)
     top = max(rect.top // cell_size, 0)
     bottom = min((rect.bottom - 1) // cell_size, max_y - 1)
+    if left > right:
+        return False
     for ty in range(top, bottom + 1):
-        row = rows[ty]
-        for tx in range(left, right + 1):
-            if row[tx] == 1:
-                return True
+        # membership test on the row slice scans the cells in C
+        if 1 in rows[ty][left:right + 1]:
+            return True
     return False
 
 
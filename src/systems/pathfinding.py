@@ -13,12 +13,27 @@ NavCache = Dict[str, Any]
 
 ORTH_COST = 10
 DIAG_COST = 14
+DIRECTIONS = (
+    (1, 0, ORTH_COST),
+    (-1, 0, ORTH_COST),
+    (0, 1, ORTH_COST),
+    (0, -1, ORTH_COST),
+    (1, 1, DIAG_COST),
+    (-1, 1, DIAG_COST),
+    (1, -1, DIAG_COST),
+    (-1, -1, DIAG_COST),
+)
 
 
 def is_walkable(val: int, passable: Set[int]) -> bool:
     return val in passable
 
 
+def passable_lut(passable: Set[int]) -> bytes:
+    """256-entry table mapping a cell value to 1 when passable, for ``bytearray.translate``."""
+    return bytes(1 if value in passable else 0 for value in range(256))
+
+
 def has_clearance(x: int, y: int, grid: Grid, passable: Set[int], *, radius_x: int, radius_y: int) -> bool:
     max_y = len(grid)
     max_x = len(grid[0]) if max_y else 0
@@ -47,17 +62,7 @@ def neighbors(
 ) -> Iterable[tuple[Node, int]]:
     max_y = len(grid)
     max_x = len(grid[0]) if max_y else 0
-    directions = (
-        (1, 0, ORTH_COST),
-        (-1, 0, ORTH_COST),
-        (0, 1, ORTH_COST),
-        (0, -1, ORTH_COST),
-        (1, 1, DIAG_COST),
-        (-1, 1, DIAG_COST),
-        (1, -1, DIAG_COST),
-        (-1, -1, DIAG_COST),
-    )
-    for dx, dy, cost in directions:
+    for dx, dy, cost in DIRECTIONS:
         nx, ny = x + dx, y + dy
         if not (0 <= nx < max_x and 0 <= ny < max_y):
             continue
@@ -81,17 +86,7 @@ def _neighbors_cached(
 ) -> Iterable[tuple[Node, int]]:
     max_y = len(walkable)
     max_x = len(walkable[0]) if max_y else 0
-    directions = (
-        (1, 0, ORTH_COST),
-        (-1, 0, ORTH_COST),
-        (0, 1, ORTH_COST),
-        (0, -1, ORTH_COST),
-        (1, 1, DIAG_COST),
-        (-1, 1, DIAG_COST),
-        (1, -1, DIAG_COST),
-        (-1, -1, DIAG_COST),
-    )
-    for dx, dy, cost in directions:
+    for dx, dy, cost in DIRECTIONS:
         nx, ny = x + dx, y + dy
         if not (0 <= nx < max_x and 0 <= ny < max_y):
             continue
@@ -133,6 +128,7 @@ def build_nav_cache(
     max_x = len(grid[0]) if max_y else 0
     radius_x, radius_y = _clearance_radius(actor_size, cell_size)
     walkable: list[list[bool]] = [[False] * max_x for _ in range(max_y)]
+    walkable_flat = bytearray(max_x * max_y)
     for y in range(max_y):
         row = grid[y]
         for x in range(max_x):
@@ -140,6 +136,7 @@ def build_nav_cache(
                 continue
             if has_clearance(x, y, grid, passable, radius_x=radius_x, radius_y=radius_y):
                 walkable[y][x] = True
+                walkable_flat[y * max_x + x] = 1
     regions: list[list[int]] = [[-1] * max_x for _ in range(max_y)]
     region_id = 0
     for y in range(max_y):
@@ -159,9 +156,11 @@ def build_nav_cache(
             region_id += 1
     return {
         "walkable": walkable,
+        "walkable_flat": walkable_flat,
         "regions": regions,
         "cell_size": cell_size,
         "actor_size": actor_size,
+        "search": {},
     }
 
 
@@ -204,6 +203,10 @@ def astar(
         if not is_walkable(grid[goal[1]][goal[0]], passable):
             return []
 
+    if walkable and nav_cache.get("walkable_flat"):
+        # uniform-cost grid: jump point search finds the same path cost with far fewer heap pushes
+        return jps_flat(nav_cache["walkable_flat"], max_x, max_y, start, goal, scratch=nav_cache.get("search"))
+
     # compute clearance in cells based on actor footprint
     radius_x, radius_y = _clearance_radius(actor_size, cell_size)
 
@@ -242,6 +245,251 @@ def astar(
     return []
 
 
+def _search_arrays(scratch: Dict[str, Any], size: int) -> int:
+    """Ensure per-cell search lists of ``size`` exist in ``scratch`` and return a fresh generation."""
+    gen = scratch.get("gen", 0) + 1
+    if len(scratch.get("closed", ())) != size:
+        scratch["seen"] = [0] * size
+        scratch["closed"] = [0] * size
+        scratch["g"] = [0] * size
+        scratch["parent"] = [0] * size
+        gen = 1
+    scratch["gen"] = gen
+    return gen
+
+
+def _scan_stops(lines: List[bytes], length: int) -> tuple[bytes, bytes]:
+    """Mark cells where a straight scan along ``lines`` must stop, in each direction.
+
+    A cell stops the scan when it is blocked or has a forced neighbour on an adjacent line.
+    Each 0/1 line is packed into one int (byte i = cell i) so the per-cell tests become a
+    handful of bitwise ops per line.
+    """
+    ones = int.from_bytes(b"\x01" * length, "little")
+    packed = [int.from_bytes(line, "little") for line in lines]
+    forward = bytearray()
+    backward = bytearray()
+    last = len(packed) - 1
+    for i, cur in enumerate(packed):
+        prev = packed[i - 1] if i > 0 else 0
+        nxt = packed[i + 1] if i < last else 0
+        blocked = cur ^ ones
+        # side cell open while the side cell one step back is not
+        fwd = blocked | (prev & ((prev << 8) ^ ones)) | (nxt & ((nxt << 8) ^ ones))
+        back = blocked | (prev & ((prev >> 8) ^ ones)) | (nxt & ((nxt >> 8) ^ ones))
+        forward += fwd.to_bytes(length, "little")
+        backward += back.to_bytes(length, "little")
+    return bytes(forward), bytes(backward)
+
+
+def _jump_tables(walkable_flat: bytearray, width: int, height: int, scratch: Dict[str, Any]) -> tuple[bytes, ...]:
+    tables = scratch.get("jump_tables")
+    if tables is None or scratch.get("jump_source") is not walkable_flat:
+        rows = [bytes(walkable_flat[y * width:(y + 1) * width]) for y in range(height)]
+        cols = [bytes(walkable_flat[x::width]) for x in range(width)]
+        east, west = _scan_stops(rows, width)
+        south, north = _scan_stops(cols, height)
+        tables = (east, west, south, north)
+        scratch["jump_tables"] = tables
+        scratch["jump_source"] = walkable_flat
+    return tables
+
+
+def jps_flat(
+    walkable_flat: bytearray,
+    width: int,
+    height: int,
+    start: Node,
+    goal: Node,
+    *,
+    scratch: Optional[Dict[str, Any]] = None,
+) -> List[Node]:
+    """Jump point search over a row-major walkable bytearray (a nav cache's ``walkable_flat``).
+
+    Same costs and movement rules as ``astar``: 8-way steps, and diagonal steps require both
+    orthogonal cells to be open. Only jump points enter the open heap; the returned path is
+    expanded back to every cell in between, so it has the same optimal cost as A* though
+    equal-cost routes may be picked differently. Passing the same ``scratch`` dict (a nav
+    cache's ``search``) reuses the per-cell lists and jump tables across calls.
+    """
+    sx, sy = start
+    gx, gy = goal
+    start_idx = sy * width + sx
+    goal_idx = gy * width + gx
+    if not walkable_flat[start_idx] or not walkable_flat[goal_idx]:
+        return []
+    if scratch is None:
+        scratch = {}
+    gen = _search_arrays(scratch, width * height)
+    seen = scratch["seen"]
+    closed = scratch["closed"]
+    g_score = scratch["g"]
+    came_from = scratch["parent"]
+
+    east, west, south, north = _jump_tables(walkable_flat, width, height, scratch)
+
+    def open_at(x: int, y: int) -> bool:
+        return 0 <= x < width and 0 <= y < height and walkable_flat[y * width + x] == 1
+
+    def jump_x(x: int, y: int, dx: int) -> Node | None:
+        if x < 0 or x >= width:
+            return None
+        base = y * width
+        if dx > 0:
+            i = east.find(1, base + x, base + width)
+            if y == gy and gx >= x and (i == -1 or gx < i - base):
+                return (gx, gy)
+        else:
+            i = west.rfind(1, base, base + x + 1)
+            if y == gy and gx <= x and gx > i - base:
+                return (gx, gy)
+        if i == -1 or not walkable_flat[i]:
+            return None
+        return (i - base, y)
+
+    def jump_y(x: int, y: int, dy: int) -> Node | None:
+        if y < 0 or y >= height:
+            return None
+        base = x * height
+        if dy > 0:
+            i = south.find(1, base + y, base + height)
+            if x == gx and gy >= y and (i == -1 or gy < i - base):
+                return (gx, gy)
+        else:
+            i = north.rfind(1, base, base + y + 1)
+            if x == gx and gy <= y and gy > i - base:
+                return (gx, gy)
+        if i == -1 or not walkable_flat[(i - base) * width + x]:
+            return None
+        return (x, i - base)
+
+    def jump(x: int, y: int, dx: int, dy: int) -> Node | None:
+        # straight scans use the stop tables; diagonals step and probe both straight scans
+        if not dy:
+            return jump_x(x, y, dx)
+        if not dx:
+            return jump_y(x, y, dy)
+        while open_at(x, y):
+            if x == gx and y == gy:
+                return (x, y)
+            if jump_x(x + dx, y, dx) or jump_y(x, y + dy, dy):
+                return (x, y)
+            if not (open_at(x + dx, y) and open_at(x, y + dy)):
+                return None
+            x += dx
+            y += dy
+        return None
+
+    def directions(x: int, y: int, parent: int) -> List[Tuple[int, int]]:
+        if parent == -1:
+            dirs = []
+            for dx, dy, _ in DIRECTIONS:
+                if not open_at(x + dx, y + dy):
+                    continue
+                if dx and dy and not (open_at(x + dx, y) and open_at(x, y + dy)):
+                    continue
+                dirs.append((dx, dy))
+            return dirs
+        px = parent % width
+        py = parent // width
+        dx = (x > px) - (x < px)
+        dy = (y > py) - (y < py)
+        dirs = []
+        if dx and dy:
+            open_y = open_at(x, y + dy)
+            open_x = open_at(x + dx, y)
+            if open_y:
+                dirs.append((0, dy))
+            if open_x:
+                dirs.append((dx, 0))
+            if open_x and open_y:
+                dirs.append((dx, dy))
+        elif dx:
+            open_next = open_at(x + dx, y)
+            open_down = open_at(x, y + 1)
+            open_up = open_at(x, y - 1)
+            if open_next:
+                dirs.append((dx, 0))
+                if open_down:
+                    dirs.append((dx, 1))
+                if open_up:
+                    dirs.append((dx, -1))
+            if open_down:
+                dirs.append((0, 1))
+            if open_up:
+                dirs.append((0, -1))
+        else:
+            open_next = open_at(x, y + dy)
+            open_right = open_at(x + 1, y)
+            open_left = open_at(x - 1, y)
+            if open_next:
+                dirs.append((0, dy))
+                if open_right:
+                    dirs.append((1, dy))
+                if open_left:
+                    dirs.append((-1, dy))
+            if open_right:
+                dirs.append((1, 0))
+            if open_left:
+                dirs.append((-1, 0))
+        return dirs
+
+    seen[start_idx] = gen
+    g_score[start_idx] = 0
+    came_from[start_idx] = -1
+    open_heap: List[Tuple[int, int, int]] = [(0, sx, sy)]
+    heappush = heapq.heappush
+    heappop = heapq.heappop
+
+    while open_heap:
+        _, x, y = heappop(open_heap)
+        idx = y * width + x
+        if idx == goal_idx:
+            jumps: List[Node] = [(x, y)]
+            idx = came_from[idx]
+            while idx != -1:
+                jumps.append((idx % width, idx // width))
+                idx = came_from[idx]
+            jumps.reverse()
+            path: List[Node] = [jumps[0]]
+            for jx, jy in jumps[1:]:
+                cx, cy = path[-1]
+                step_x = (jx > cx) - (jx < cx)
+                step_y = (jy > cy) - (jy < cy)
+                while cx != jx or cy != jy:
+                    cx += step_x
+                    cy += step_y
+                    path.append((cx, cy))
+            return path
+        if closed[idx] == gen:
+            continue
+        closed[idx] = gen
+        g = g_score[idx]
+        for dx, dy in directions(x, y, came_from[idx]):
+            point = jump(x + dx, y + dy, dx, dy)
+            if point is None:
+                continue
+            jx, jy = point
+            jidx = jy * width + jx
+            if closed[jidx] == gen:
+                continue
+            ax = jx - x if jx >= x else x - jx
+            ay = jy - y if jy >= y else y - jy
+            tentative = g + (DIAG_COST * ax if ax == ay else ORTH_COST * (ax + ay))
+            if seen[jidx] != gen or tentative < g_score[jidx]:
+                seen[jidx] = gen
+                came_from[jidx] = idx
+                g_score[jidx] = tentative
+                hx = jx - gx if jx >= gx else gx - jx
+                hy = jy - gy if jy >= gy else gy - jy
+                if hx < hy:
+                    h = DIAG_COST * hx + ORTH_COST * (hy - hx)
+                else:
+                    h = DIAG_COST * hy + ORTH_COST * (hx - hy)
+                heappush(open_heap, (tentative + h, jx, jy))
+    return []
+
+
 def nearest_reachable(
     grid: Grid,
     start: Node,
@@ -274,9 +522,9 @@ def nearest_reachable(
         if not has_clearance(sx, sy, grid, passable, radius_x=radius_x, radius_y=radius_y):
             return None
 
-    visited: set[Node] = set()
+    visited = bytearray(max_x * max_y)
+    visited[sy * max_x + sx] = 1
     q = deque([(start, 0)])
-    visited.add(start)
     best: Node | None = None
     best_dist = 1_000_000
     max_steps = max(0, max_distance_px // cell_size)
@@ -296,9 +544,10 @@ def nearest_reachable(
         else:
             neighbor_iter = neighbors(cx, cy, grid, passable, radius_x=radius_x, radius_y=radius_y)
         for (nx, ny), _ in neighbor_iter:
-            if (nx, ny) in visited:
+            idx = ny * max_x + nx
+            if visited[idx]:
                 continue
-            visited.add((nx, ny))
+            visited[idx] = 1
             q.append(((nx, ny), depth + 1))
 
     return best
@@ -0,0 +1,65 @@
+import os
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pytest  # noqa: E402
+
+from src.core.game import Game  # noqa: E402
+
+
+@pytest.fixture(scope="module")
+def game():
+    g = Game()
+    g.in_menu = False
+    return g
+
+
+def _assert_mask_in_sync(g):
+    lut = g._passable_lut
+    assert g._passable_mask == [row.translate(lut) for row in g.map_data.collision_grid]
+
+
+def test_floor_load_builds_mask(game):
+    for floor in ("F50", "F40", "F35", "F15"):
+        game._debug_warp_to_floor(floor)
+        _assert_mask_in_sync(game)
+
+
+def test_trap_spans_keep_mask_and_version_in_sync(game):
+    game._debug_warp_to_floor("F40")
+    game._lab_init_traps()
+    assert game.lab_traps, "F40 should define lab traps"
+    spans = game.lab_traps[0]["spans"]
+    for solid in (True, False):
+        game._lab_set_spans(spans, not solid)
+        version = game._grid_version
+        game._lab_set_spans(spans, solid)
+        assert game._grid_version > version
+        _assert_mask_in_sync(game)
+    # re-applying the same state is not a change
+    version = game._grid_version
+    game._lab_set_spans(spans, False)
+    assert game._grid_version == version
+
+
+def test_mirror_axis_toggle_keeps_mask_and_version_in_sync(game):
+    game._debug_warp_to_floor("F15")
+    if game.mirror_state.get("axis_col") is None:
+        pytest.skip("F15 has no mirror axis column")
+    for locked in (True, False):
+        version = game._grid_version
+        game._mirror_apply_axis_lock(locked)
+        assert game._grid_version > version
+        _assert_mask_in_sync(game)
+
+
+def test_floor_restore_resets_grid_and_mask(game):
+    game._debug_warp_to_floor("F40")
+    game._lab_init_traps()
+    base = [bytes(row) for row in game._base_collision_grid]
+    game._lab_set_spans(game.lab_traps[0]["spans"], True)
+    game._debug_warp_to_floor("F35")
+    game._debug_warp_to_floor("F40")
+    _assert_mask_in_sync(game)
+    assert [bytes(row) for row in game._base_collision_grid] == base
@@ -0,0 +1,96 @@
+import heapq
+import random
+
+import pytest
+
+from src.core import settings
+from src.maps.loader import load_map
+from src.systems import pathfinding
+
+FLOORS = sorted(settings.MAPS_DIR.glob("floor*.json"))
+
+
+def _reference_costs(flat, width, height, start):
+    """Plain Dijkstra over the same 8-way, no-corner-cutting moves; cost to every reachable cell."""
+    dist = {start: 0}
+    heap = [(0, start)]
+    while heap:
+        d, (x, y) = heapq.heappop(heap)
+        if d > dist[(x, y)]:
+            continue
+        for dx, dy, cost in pathfinding.DIRECTIONS:
+            nx, ny = x + dx, y + dy
+            if not (0 <= nx < width and 0 <= ny < height) or not flat[ny * width + nx]:
+                continue
+            if dx and dy and not (flat[y * width + nx] and flat[ny * width + x]):
+                continue
+            nd = d + cost
+            if nd < dist.get((nx, ny), nd + 1):
+                dist[(nx, ny)] = nd
+                heapq.heappush(heap, (nd, (nx, ny)))
+    return dist
+
+
+def _path_cost(path, flat, width):
+    cost = 0
+    for (x, y), (nx, ny) in zip(path, path[1:]):
+        dx, dy = nx - x, ny - y
+        assert max(abs(dx), abs(dy)) == 1, f"non-adjacent step {(x, y)} -> {(nx, ny)}"
+        assert flat[ny * width + nx], f"step into blocked cell {(nx, ny)}"
+        if dx and dy:
+            assert flat[y * width + nx] and flat[ny * width + x], f"corner cut at {(x, y)} -> {(nx, ny)}"
+            cost += pathfinding.DIAG_COST
+        else:
+            cost += pathfinding.ORTH_COST
+    return cost
+
+
+def _check_pairs(flat, width, height, rng, starts, goals_per_start, scratch):
+    cells = [(i % width, i // width) for i in range(width * height) if flat[i]]
+    for _ in range(starts):
+        start = rng.choice(cells)
+        costs = _reference_costs(flat, width, height, start)
+        for goal in rng.sample(cells, min(goals_per_start, len(cells))):
+            path = pathfinding.jps_flat(flat, width, height, start, goal, scratch=scratch)
+            if goal not in costs:
+                assert path == []
+                continue
+            assert path[0] == start and path[-1] == goal
+            assert _path_cost(path, flat, width) == costs[goal]
+
+
+@pytest.mark.parametrize("density", [0.0, 0.1, 0.25, 0.4])
+def test_jps_matches_reference_on_random_grids(density):
+    rng = random.Random(int(density * 100))
+    for _ in range(5):
+        width, height = rng.randint(8, 40), rng.randint(8, 40)
+        flat = bytearray(0 if rng.random() < density else 1 for _ in range(width * height))
+        if not any(flat):
+            continue
+        _check_pairs(flat, width, height, rng, starts=4, goals_per_start=10, scratch={})
+
+
+@pytest.mark.parametrize("path", FLOORS, ids=lambda p: p.stem)
+def test_jps_matches_reference_on_floor_maps(path):
+    map_data = load_map(path)
+    grid = map_data.collision_grid
+    cache = pathfinding.build_nav_cache(
+        grid,
+        settings.PASSABLE_VALUES,
+        cell_size=map_data.cell_size,
+        actor_size=settings.PLAYER_SIZE,
+    )
+    flat = cache["walkable_flat"]
+    if not any(flat):
+        pytest.skip("no walkable cells for the player footprint")
+    width, height = len(grid[0]), len(grid)
+    # reuse the cache scratch across searches, as the game does
+    _check_pairs(flat, width, height, random.Random(path.stem), starts=3, goals_per_start=6, scratch=cache["search"])
+
+
+def test_astar_with_nav_cache_returns_valid_path():
+    grid = [bytearray(b"\x00\x00\x00\x00"), bytearray(b"\x00\x01\x01\x00"), bytearray(b"\x00\x00\x00\x00")]
+    cache = pathfinding.build_nav_cache(grid, {0})
+    path = pathfinding.astar(grid, (0, 1), (3, 1), {0}, nav_cache=cache)
+    assert path[0] == (0, 1) and path[-1] == (3, 1)
+    assert _path_cost(path, cache["walkable_flat"], 4) == _reference_costs(cache["walkable_flat"], 4, 3, (0, 1))[(3, 1)]
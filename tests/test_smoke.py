@@ -1,2 +1,2 @@
 def test_import():
-    from MindscapeArk.src.main import main  # noqa: F401
+    from src.main import main  # noqa: F401